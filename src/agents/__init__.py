@@ -30,7 +30,7 @@ from infrastructure.gigachat_adapter import GigaChatAdapter
 from infrastructure.preview_plan_store import PreviewPlanStore
 from infrastructure.scenario_index_store import ScenarioIndexStore
 from memory import MemoryRepository, MemoryService
-from infrastructure.step_index_store import StepIndexStore
+from infrastructure.step_index_store import SqliteStepIndexStore, StepIndexStore
 from integrations.jira_testcase_provider import JiraTestcaseProvider
 from tools.cucumber_expression import cucumber_expression_to_regex
 from tools.feature_generator import FeatureGenerator
@@ -261,7 +261,10 @@ def create_orchestrator(settings: Settings | None = None):
         corp_retry_max_delay_s=resolved_settings.corp_retry_max_delay_s,
         corp_retry_jitter_s=resolved_settings.corp_retry_jitter_s,
     )
-    step_index_store = StepIndexStore(resolved_settings.steps_index_dir)
+    if resolved_settings.steps_index_backend == "sqlite":
+        step_index_store = SqliteStepIndexStore(resolved_settings.steps_index_dir)
+    else:
+        step_index_store = StepIndexStore(resolved_settings.steps_index_dir)
     service_data_dir = Path(resolved_settings.steps_index_dir).parent
     embeddings_store = EmbeddingsStore(service_data_dir / "chroma")
     scenario_index_store = ScenarioIndexStore(service_data_dir / "scenario_index")
@@ -277,6 +280,7 @@ def create_orchestrator(settings: Settings | None = None):
         embeddings_store,
         scenario_index_store=scenario_index_store,
         llm_client=agent_llm_client,
+        scan_workers=resolved_settings.steps_scan_workers,
     )
     testcase_parser = TestcaseParserAgent(agent_llm_client)
     step_matcher = StepMatcherAgent(
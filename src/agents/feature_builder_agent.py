@@ -1,9 +1,14 @@
 """Агент для генерации .feature текста из сопоставленных шагов."""
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import Any
 
+import orjson
+
 from agents import _deserialize_matched_step, _deserialize_scenario, _serialize_feature
 from domain.enums import MatchStatus
 from domain.models import FeatureFile, MatchedStep, Scenario
@@ -12,6 +17,8 @@ from tools.feature_generator import FeatureGenerator
 
 logger = logging.getLogger(__name__)
 
+_RESULT_CACHE_SIZE = 256
+
 
 class FeatureBuilderAgent:
     """Оберта над FeatureGenerator для построения итогового feature-файла."""
@@ -19,6 +26,8 @@ class FeatureBuilderAgent:
     def __init__(self, llm_client: LLMClient | None = None) -> None:
         self.llm_client = llm_client
         self.generator = FeatureGenerator()
+        self._result_cache: OrderedDict[bytes, bytes] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
 
     def build_feature_from_matches(
         self,
@@ -26,8 +35,56 @@ class FeatureBuilderAgent:
         matched_steps_dicts: list[dict[str, Any]],
         language: str | None = None,
     ) -> dict[str, Any]:
-        """Собирает доменную модель feature и отдаёт сериализуемый результат."""
+        """Собирает доменную модель feature и отдаёт сериализуемый результат.
+
+        Сборка детерминирована, поэтому результат кэшируется по хэшу входных данных:
+        повторные попытки с теми же шагами не пересобирают feature заново.
+        """
+
+        cache_key = self._cache_key(scenario_dict, matched_steps_dicts, language)
+        if cache_key is not None:
+            with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+            if cached is not None:
+                # Каждый вызов получает собственную копию результата.
+                return orjson.loads(cached)
+
+        result = self._build_feature_from_matches(scenario_dict, matched_steps_dicts, language)
+        if cache_key is not None:
+            try:
+                serialized = orjson.dumps(result)
+            except TypeError:
+                return result
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = serialized
+                self._result_cache.move_to_end(cache_key)
+                while len(self._result_cache) > _RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _cache_key(
+        scenario_dict: dict[str, Any],
+        matched_steps_dicts: list[dict[str, Any]],
+        language: str | None,
+    ) -> bytes | None:
+        try:
+            raw = orjson.dumps(
+                [scenario_dict, matched_steps_dicts, language],
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            return None
+        return hashlib.blake2b(raw, digest_size=16).digest()
 
+    def _build_feature_from_matches(
+        self,
+        scenario_dict: dict[str, Any],
+        matched_steps_dicts: list[dict[str, Any]],
+        language: str | None,
+    ) -> dict[str, Any]:
         scenario: Scenario = _deserialize_scenario(scenario_dict)
         matched_steps: list[MatchedStep] = [
             _deserialize_matched_step(entry) for entry in matched_steps_dicts
@@ -17,7 +17,7 @@ from infrastructure.fs_repo import FsRepository
 from infrastructure.llm_client import LLMClient
 from infrastructure.scenario_index_store import ScenarioIndexStore
 from infrastructure.step_index_store import StepIndexStore
-from tools.cucumber_expression import cucumber_expression_to_regex
+from tools.cucumber_expression import cucumber_expression_compiled, cucumber_expression_to_regex
 from tools.scenario_catalog import extract_scenarios
 from tools.step_extractor import StepExtractor
 
@@ -58,6 +58,7 @@ class RepoScannerAgent:
         file_patterns: list[str] | None = None,
         external_file_patterns: list[str] | None = None,
         feature_patterns: list[str] | None = None,
+        scan_workers: int = 0,
     ) -> None:
         self.step_index_store = step_index_store
         self.embeddings_store = embeddings_store
@@ -66,6 +67,7 @@ class RepoScannerAgent:
         self.file_patterns = file_patterns or list(DEFAULT_PROJECT_FILE_PATTERNS)
         self.external_file_patterns = external_file_patterns or list(DEFAULT_EXTERNAL_FILE_PATTERNS)
         self.feature_patterns = feature_patterns or ["**/*.feature"]
+        self.scan_workers = scan_workers
 
     def scan_repository(
         self,
@@ -145,7 +147,7 @@ class RepoScannerAgent:
         file_patterns = self.file_patterns if is_primary_root else self.external_file_patterns
 
         if root_path.is_dir():
-            extractor = StepExtractor(FsRepository(str(root_path)), file_patterns)
+            extractor = StepExtractor(FsRepository(str(root_path)), file_patterns, max_workers=self.scan_workers)
             steps = extractor.extract_steps()
             if not is_primary_root:
                 self._prefix_external_steps(steps, str(root_path))
@@ -339,13 +341,14 @@ class RepoScannerAgent:
         return fallback if fallback_score >= 0.8 else None
 
     def _line_matches_step(self, step: StepDefinition, line_text: str) -> bool:
-        regex = step.regex or (
-            cucumber_expression_to_regex(step.pattern)
-            if step.pattern_type is StepPatternType.CUCUMBER_EXPRESSION
-            else step.pattern
-        )
         try:
-            if regex and re.search(regex, line_text):
+            if step.regex:
+                matched = re.search(step.regex, line_text)
+            elif step.pattern_type is StepPatternType.CUCUMBER_EXPRESSION:
+                matched = cucumber_expression_compiled(step.pattern).search(line_text)
+            else:
+                matched = step.pattern and re.search(step.pattern, line_text)
+            if matched:
                 return True
         except re.error:
             pass
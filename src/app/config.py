@@ -38,6 +38,17 @@ class Settings(BaseSettings):
     port: int = Field(default=8000, description="Bind port")
     log_request_bodies: bool = Field(default=False, description="Enable request body logging for diagnostics")
     steps_index_dir: Path = Field(default=ROOT_DIR / ".agent" / "steps_index", description="Path to steps index")
+    steps_index_backend: str = Field(
+        default="msgpack",
+        description="Steps index storage backend: msgpack|sqlite (json is a deprecated alias of msgpack)",
+    )
+    steps_scan_workers: int = Field(
+        default=0,
+        description=(
+            "Worker processes for parsing step sources on large scans (0 = serial). "
+            "Workers are spawned, so entry points must guard startup with if __name__ == '__main__'"
+        ),
+    )
     artifacts_dir: Path = Field(
         default=ROOT_DIR / ".agent" / "artifacts",
         description="Directory for job artifacts and incidents",
@@ -342,6 +353,15 @@ class Settings(BaseSettings):
             raise ValueError("match_llm_shortlist must be >= 1")
         if self.match_llm_min_confidence < 0 or self.match_llm_min_confidence > 1:
             raise ValueError("match_llm_min_confidence must be in [0, 1]")
+        if self.steps_scan_workers < 0:
+            raise ValueError("steps_scan_workers must be >= 0")
+        if self.steps_index_backend == "json":
+            logging.getLogger(__name__).warning(
+                "steps_index_backend=json is deprecated, the file index is stored as msgpack; use msgpack"
+            )
+            self.steps_index_backend = "msgpack"
+        if self.steps_index_backend not in {"msgpack", "sqlite"}:
+            raise ValueError("steps_index_backend must be one of: msgpack, sqlite (json is a deprecated alias)")
         if self.state_backend not in {"memory", "postgres"}:
             raise ValueError("state_backend must be one of: memory, postgres")
         if self.execution_backend not in {"local", "queue"}:
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import uuid
 import warnings
@@ -178,6 +177,16 @@ async def _shutdown_app(app: FastAPI) -> None:
     if embeddings_store is not None and hasattr(embeddings_store, "close"):
         embeddings_store.close()
 
+    step_index_store = getattr(getattr(app.state, "orchestrator", None), "step_index_store", None)
+    if step_index_store is not None and hasattr(step_index_store, "close"):
+        step_index_store.close()
+
+    jira_testcase_provider = getattr(getattr(app.state, "orchestrator", None), "jira_testcase_provider", None)
+    if jira_testcase_provider is not None and hasattr(jira_testcase_provider, "aclose"):
+        await jira_testcase_provider.aclose()
+    elif jira_testcase_provider is not None and hasattr(jira_testcase_provider, "close"):
+        jira_testcase_provider.close()
+
     logger.info("Сервис %s останавливается", settings.app_name)
 
 
@@ -324,27 +333,7 @@ def _preload_step_indexes(_: FastAPI, orchestrator) -> None:
         logger.warning("[Startup] Хранилище индекса шагов не найдено")
         return
 
-    index_dir: Path | None = getattr(step_index_store, "_index_dir", None)
-    if not index_dir:
-        logger.warning("[Startup] Каталог индекса шагов не задан")
-        return
-
-    index_dir.mkdir(parents=True, exist_ok=True)
-    total_steps = 0
-    for project_dir in index_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
-
-        steps_file = project_dir / "steps.json"
-        if not steps_file.exists():
-            continue
-
-        try:
-            data = json.loads(steps_file.read_text(encoding="utf-8"))
-            total_steps += len(data.get("steps", []))
-        except (OSError, json.JSONDecodeError) as exc:
-            logger.warning("[Startup] Не удалось прочитать индекс %s: %s", steps_file, exc)
-
+    total_steps = step_index_store.count_steps()
     logger.info("[Startup] Предзагружено шагов из индекса: %s", total_steps)
 
 
@@ -2,10 +2,9 @@
 from __future__ import annotations
 
 from collections import Counter
-from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from time import perf_counter
-from typing import Iterator
 
 
 @dataclass
@@ -27,13 +26,29 @@ class InMemoryMetrics:
 metrics = InMemoryMetrics()
 
 
-@contextmanager
-def traced_span(name: str) -> Iterator[None]:
-    _ = name
-    _started = perf_counter()
-    try:
-        yield
-    finally:
-        elapsed_ms = int((perf_counter() - _started) * 1000)
-        metrics.inc(f"trace.{name}.count")
-        metrics.inc(f"trace.{name}.elapsed_ms_total", elapsed_ms)
+class _Span:
+    """Контекстный менеджер span'а: без генератора и с заранее собранными именами метрик."""
+
+    __slots__ = ("_count_metric", "_elapsed_metric", "_started")
+
+    def __init__(self, count_metric: str, elapsed_metric: str) -> None:
+        self._count_metric = count_metric
+        self._elapsed_metric = elapsed_metric
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = perf_counter()
+
+    def __exit__(self, *_exc_info: object) -> None:
+        elapsed_ms = int((perf_counter() - self._started) * 1000)
+        metrics.inc(self._count_metric)
+        metrics.inc(self._elapsed_metric, elapsed_ms)
+
+
+@lru_cache(maxsize=256)
+def _span_metric_names(name: str) -> tuple[str, str]:
+    return f"trace.{name}.count", f"trace.{name}.elapsed_ms_total"
+
+
+def traced_span(name: str) -> _Span:
+    return _Span(*_span_metric_names(name))
@@ -17,14 +17,7 @@ class StepKeyword(str, Enum):
         """Возвращает строковое представление ключевого слова."""
 
         if language and language.casefold() == "ru":
-            localized = {
-                StepKeyword.GIVEN: "Дано",
-                StepKeyword.WHEN: "Когда",
-                StepKeyword.THEN: "Тогда",
-                StepKeyword.AND: "И",
-                StepKeyword.BUT: "Но",
-            }
-            return localized[self]
+            return _RU_STEP_KEYWORDS[self]
         return self.value
 
     @classmethod
@@ -65,7 +58,7 @@ class StepKeyword(str, Enum):
             raise ValueError("Keyword cannot be empty")
 
         try:
-            return cls._alias_map()[normalized]
+            return _STEP_KEYWORD_ALIASES[normalized]
         except KeyError as error:
             raise ValueError(f"Unsupported step keyword: {keyword}") from error
 
@@ -73,7 +66,17 @@ class StepKeyword(str, Enum):
     def supported_keywords(cls) -> set[str]:
         """Возвращает множество всех поддерживаемых написаний ключевых слов."""
 
-        return set(cls._alias_map().keys())
+        return set(_STEP_KEYWORD_ALIASES)
+
+
+_STEP_KEYWORD_ALIASES: dict[str, StepKeyword] = StepKeyword._alias_map()
+_RU_STEP_KEYWORDS: dict[StepKeyword, str] = {
+    StepKeyword.GIVEN: "Дано",
+    StepKeyword.WHEN: "Когда",
+    StepKeyword.THEN: "Тогда",
+    StepKeyword.AND: "И",
+    StepKeyword.BUT: "Но",
+}
 
 
 class MatchStatus(str, Enum):
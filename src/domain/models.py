@@ -1,7 +1,9 @@
 """Доменные модели для описания шагов, сценариев и feature-файлов."""
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, Iterable
 
 from .enums import MatchStatus, ScenarioType, StepIntentType, StepKeyword, StepPatternType
@@ -17,12 +19,28 @@ GHERKIN_KEYWORDS: dict[str, dict[str, str]] = {
 }
 
 
+# Плоская таблица (ключевое слово, язык) -> перевод, собирается один раз при импорте.
+_LOCALIZED_GHERKIN_KEYWORDS: dict[tuple[str, str], str] = {
+    (keyword, language): localized
+    for language, keywords in GHERKIN_KEYWORDS.items()
+    for keyword, localized in keywords.items()
+}
+
+
 def localize_gherkin_keyword(keyword: str, language: str | None) -> str:
     """Возвращает локализованное ключевое слово Gherkin."""
 
-    if not language:
-        return keyword
-    return GHERKIN_KEYWORDS.get(language, {}).get(keyword, keyword)
+    return _LOCALIZED_GHERKIN_KEYWORDS.get((keyword, language), keyword)
+
+
+@lru_cache(maxsize=4096)
+def _compile_step_regex(regex: str) -> re.Pattern[str] | None:
+    """Компилирует регулярку шага один раз; некорректный шаблон даёт None."""
+
+    try:
+        return re.compile(regex)
+    except re.error:
+        return None
 
 
 @dataclass
@@ -83,6 +101,12 @@ class StepDefinition:
             impl = self.implementation
             self.implementation = StepImplementation(**impl) if isinstance(impl, dict) else None
 
+    @property
+    def compiled_regex(self) -> re.Pattern[str] | None:
+        """Скомпилированная ``regex`` шага (None, если регулярки нет или она некорректна)."""
+
+        return _compile_step_regex(self.regex) if self.regex is not None else None
+
     @staticmethod
     def _normalize_parameters(parameters: Iterable[StepParameter | str | dict]) -> Iterable[StepParameter]:
         for param in parameters:
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from infrastructure.artifact_index_store import ArtifactIndexStore
 from infrastructure.object_storage import LocalObjectStorage, ObjectStorage
 
@@ -16,6 +17,11 @@ def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _dump_json(payload: dict[str, Any]) -> bytes:
+    # Same layout as json.dumps(..., ensure_ascii=False, indent=2): UTF-8 text, 2-space indent.
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
 class ArtifactStore:
     """Stores artifacts in an object backend and can publish logical artifact URIs via an index."""
 
@@ -46,7 +52,7 @@ class ArtifactStore:
         self, *, run_id: str, execution_id: str, attempt_id: str, name: str, payload: dict[str, Any]
     ) -> str:
         path = self._run_dir(run_id, execution_id, attempt_id) / name
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        path.write_bytes(_dump_json(payload))
         return str(path)
 
     def write_incident(self, run_id: str, payload: dict[str, Any]) -> str:
@@ -54,7 +60,7 @@ class ArtifactStore:
         target.mkdir(parents=True, exist_ok=True)
         stamp = _utcnow().strftime("%Y%m%d-%H%M%S")
         path = target / f"incident-{stamp}.json"
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        path.write_bytes(_dump_json(payload))
         return str(path)
 
     def publish_json(
@@ -66,16 +72,17 @@ class ArtifactStore:
         run_id: str | None = None,
         execution_id: str | None = None,
         attempt_id: str | None = None,
+        artifact_id: str | None = None,
     ) -> dict[str, Any]:
-        content = json.dumps(payload, ensure_ascii=False, indent=2)
-        return self.publish_text(
+        return self._publish_bytes(
             name=name,
-            content=content,
+            content=_dump_json(payload),
             media_type="application/json",
             connector_source=connector_source,
             run_id=run_id,
             execution_id=execution_id,
             attempt_id=attempt_id,
+            artifact_id=artifact_id,
         )
 
     def publish_incident(
@@ -115,6 +122,10 @@ class ArtifactStore:
             attempt_id=attempt_id,
         )
 
+    @staticmethod
+    def artifact_uri(artifact_id: str) -> str:
+        return f"artifact://{artifact_id}"
+
     def get_artifact(self, artifact_id: str) -> dict[str, Any] | None:
         if self._index_store is None:
             return None
@@ -152,8 +163,9 @@ class ArtifactStore:
         run_id: str | None,
         execution_id: str | None,
         attempt_id: str | None,
+        artifact_id: str | None = None,
     ) -> dict[str, Any]:
-        artifact_id = str(uuid.uuid4())
+        artifact_id = artifact_id or str(uuid.uuid4())
         safe_name = Path(name).name or "artifact.bin"
         storage_name = f"{artifact_id}-{safe_name}"
         storage_metadata = self._object_storage.put_bytes(
@@ -167,7 +179,7 @@ class ArtifactStore:
             "executionId": execution_id,
             "attemptId": attempt_id,
             "name": safe_name,
-            "uri": f"artifact://{artifact_id}",
+            "uri": self.artifact_uri(artifact_id),
             "mediaType": media_type,
             "size": len(content),
             "checksum": hashlib.sha256(content).hexdigest(),
@@ -8,6 +8,8 @@ FsRepository предоставляет единый интерфейс для 
 
 from __future__ import annotations
 
+import mmap
+import os
 from pathlib import Path
 from typing import Iterable
 
@@ -48,6 +50,22 @@ class FsRepository:
         file_path = self._root / relative_path
         return file_path.read_text(encoding="utf-8")
 
+    def stat(self, relative_path: str) -> os.stat_result:
+        """Возвращает метаданные файла (время изменения, размер) по относительному пути."""
+
+        return (self._root / relative_path).stat()
+
+    def file_contains(self, relative_path: str, needle: bytes) -> bool:
+        """Проверяет наличие байтовой подстроки в файле без чтения и декодирования целиком."""
+
+        file_path = self._root / relative_path
+        with file_path.open("rb") as handle:
+            try:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    return buffer.find(needle) != -1
+            except ValueError:  # пустой файл нельзя отобразить в память
+                return False
+
     def write_text_file(self, relative_path: str, content: str, create_dirs: bool = True) -> None:
         """Записывает текстовый файл, при необходимости создавая директории."""
 
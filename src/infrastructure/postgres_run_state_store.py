@@ -1,12 +1,13 @@
 """Postgres-backed run state store using explicit control-plane tables."""
 from __future__ import annotations
 
-import json
 from copy import deepcopy
 from datetime import datetime, timezone
 from threading import RLock
 from typing import Any
 
+import orjson
+
 
 def _utcnow() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -120,14 +121,15 @@ class PostgresRunStateStore:
 
     @staticmethod
     def _dumps(payload: Any) -> str:
-        return json.dumps(payload, ensure_ascii=False)
+        # Stored as jsonb, so compact orjson output is equivalent to json.dumps here.
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
 
     @staticmethod
     def _loads(payload: Any) -> Any:
         if isinstance(payload, (dict, list)):
             return payload
         if isinstance(payload, str):
-            return json.loads(payload)
+            return orjson.loads(payload)
         return None
 
     @staticmethod
@@ -381,6 +383,12 @@ class PostgresRunStateStore:
                 attempts = self._load_attempts(cur, run_id)
             return self._row_to_job(row, attempts)
 
+    def get_job_bytes(self, run_id: str) -> bytes | None:
+        job = self.get_job(run_id)
+        if not job:
+            return None
+        return orjson.dumps(job, option=orjson.OPT_NON_STR_KEYS)
+
     def patch_job(self, run_id: str, **changes: Any) -> dict[str, Any] | None:
         with self._lock:
             job = self.get_job(run_id)
@@ -405,24 +413,52 @@ class PostgresRunStateStore:
     def patch_attempt(self, run_id: str, attempt_id: str, **changes: Any) -> dict[str, Any] | None:
         with self._lock, self._connect() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT payload
-                    FROM cp_run_attempts
-                    WHERE run_id = %s AND attempt_id = %s
-                    """,
-                    (run_id, attempt_id),
-                )
-                row = cur.fetchone()
-                if not row:
+                payload = self._patch_attempt_row(cur, run_id, attempt_id, changes)
+                if payload is None:
                     return None
-                payload = self._loads(row[0]) or {}
-                payload.update(changes)
-                self._insert_attempt(cur, run_id, payload)
             conn.commit()
         self.patch_job(run_id)
         return deepcopy(payload)
 
+    def patch_attempt_and_event(
+        self,
+        run_id: str,
+        attempt_id: str,
+        *,
+        event_type: str,
+        event_payload: dict[str, Any],
+        **changes: Any,
+    ) -> dict[str, Any] | None:
+        """Apply ``patch_attempt`` and ``append_event`` in a single transaction."""
+        with self._lock, self._connect() as conn:
+            with conn.cursor() as cur:
+                payload = self._patch_attempt_row(cur, run_id, attempt_id, changes)
+                self._insert_event(cur, run_id, event_type, event_payload)
+            conn.commit()
+        if payload is None:
+            return None
+        self.patch_job(run_id)
+        return deepcopy(payload)
+
+    def _patch_attempt_row(
+        self, cur, run_id: str, attempt_id: str, changes: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        cur.execute(
+            """
+            SELECT payload
+            FROM cp_run_attempts
+            WHERE run_id = %s AND attempt_id = %s
+            """,
+            (run_id, attempt_id),
+        )
+        row = cur.fetchone()
+        if not row:
+            return None
+        payload = self._loads(row[0]) or {}
+        payload.update(changes)
+        self._insert_attempt(cur, run_id, payload)
+        return payload
+
     def list_attempts(self, run_id: str) -> list[dict[str, Any]]:
         with self._lock, self._connect() as conn:
             with conn.cursor() as cur:
@@ -431,31 +467,50 @@ class PostgresRunStateStore:
     def append_event(self, run_id: str, event_type: str, payload: dict[str, Any]) -> None:
         with self._lock, self._connect() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT next_idx FROM cp_run_event_cursor WHERE run_id = %s FOR UPDATE",
-                    (run_id,),
-                )
-                row = cur.fetchone()
-                idx = int(row[0]) if row else 0
-                cur.execute(
-                    """
-                    INSERT INTO cp_run_events (run_id, idx, event_type, payload, created_at)
-                    VALUES (%s, %s, %s, %s::jsonb, NOW())
-                    """,
-                    (run_id, idx, event_type, self._dumps(payload)),
-                )
-                if row:
-                    cur.execute(
-                        "UPDATE cp_run_event_cursor SET next_idx = %s WHERE run_id = %s",
-                        (idx + 1, run_id),
-                    )
-                else:
-                    cur.execute(
-                        "INSERT INTO cp_run_event_cursor (run_id, next_idx) VALUES (%s, %s)",
-                        (run_id, idx + 1),
-                    )
+                self._insert_event(cur, run_id, event_type, payload)
             conn.commit()
 
+    def append_events(self, run_id: str, events: list[tuple[str, dict[str, Any]]]) -> None:
+        """Append several events in one transaction with a single cursor update."""
+        if not events:
+            return
+        with self._lock, self._connect() as conn:
+            with conn.cursor() as cur:
+                self._insert_events(cur, run_id, events)
+            conn.commit()
+
+    def _insert_event(self, cur, run_id: str, event_type: str, payload: dict[str, Any]) -> None:
+        self._insert_events(cur, run_id, [(event_type, payload)])
+
+    def _insert_events(self, cur, run_id: str, events: list[tuple[str, dict[str, Any]]]) -> None:
+        cur.execute(
+            "SELECT next_idx FROM cp_run_event_cursor WHERE run_id = %s FOR UPDATE",
+            (run_id,),
+        )
+        row = cur.fetchone()
+        idx = int(row[0]) if row else 0
+        cur.executemany(
+            """
+            INSERT INTO cp_run_events (run_id, idx, event_type, payload, created_at)
+            VALUES (%s, %s, %s, %s::jsonb, NOW())
+            """,
+            [
+                (run_id, idx + offset, event_type, self._dumps(payload))
+                for offset, (event_type, payload) in enumerate(events)
+            ],
+        )
+        next_idx = idx + len(events)
+        if row:
+            cur.execute(
+                "UPDATE cp_run_event_cursor SET next_idx = %s WHERE run_id = %s",
+                (next_idx, run_id),
+            )
+        else:
+            cur.execute(
+                "INSERT INTO cp_run_event_cursor (run_id, next_idx) VALUES (%s, %s)",
+                (run_id, next_idx),
+            )
+
     def list_events(self, run_id: str, since_index: int = 0) -> tuple[list[dict[str, Any]], int]:
         floor = max(0, int(since_index))
         with self._lock, self._connect() as conn:
@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 
 def _utcnow() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -35,6 +37,8 @@ class ProjectLearningStore:
     def __init__(self, base_dir: Path) -> None:
         self._base_dir = base_dir
         self._base_dir.mkdir(parents=True, exist_ok=True)
+        # file name -> (payload digest, updatedAt, st_mtime_ns, st_size) of this store's last write
+        self._save_digests: dict[str, tuple[bytes, Any, int, int]] = {}
 
     def _path(self, project_root: str) -> Path:
         return self._base_dir / f"{_project_key(project_root)}.json"
@@ -65,11 +69,31 @@ class ProjectLearningStore:
     def save(self, project_root: str, payload: dict[str, Any]) -> dict[str, Any]:
         data = dict(payload)
         data["projectRoot"] = project_root
-        data["updatedAt"] = _utcnow()
         path = self._path(project_root)
+        comparable = {key: value for key, value in data.items() if key != "updatedAt"}
+        digest = hashlib.blake2b(orjson.dumps(comparable, option=orjson.OPT_SORT_KEYS)).digest()
+        previous = self._save_digests.get(path.name)
+        if previous is not None and previous[0] == digest and self._file_signature(path) == previous[2:]:
+            # Unchanged payload and the file is still exactly what this store last wrote.
+            data["updatedAt"] = previous[1]
+            return data
+        data["updatedAt"] = _utcnow()
         path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        signature = self._file_signature(path)
+        if signature is None:
+            self._save_digests.pop(path.name, None)
+        else:
+            self._save_digests[path.name] = (digest, data["updatedAt"], *signature)
         return data
 
+    @staticmethod
+    def _file_signature(path: Path) -> tuple[int, int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def patch(self, project_root: str, **changes: Any) -> dict[str, Any]:
         payload = self.load(project_root)
         for key, value in changes.items():
@@ -103,11 +127,16 @@ class ProjectLearningStore:
         now = datetime.now(timezone.utc)
         half_life_days = 60.0
         for key, value in boosts.items():
-            try:
-                step_id = str(key)
+            if isinstance(value, (int, float)):
                 raw_boost = float(value)
-            except (TypeError, ValueError):
+            elif isinstance(value, str):
+                try:
+                    raw_boost = float(value)
+                except ValueError:
+                    continue
+            else:
                 continue
+            step_id = key if isinstance(key, str) else str(key)
             last_feedback_at = feedback_timestamps.get(step_id)
             if last_feedback_at is None:
                 result[step_id] = raw_boost
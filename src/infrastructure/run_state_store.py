@@ -1,18 +1,39 @@
 """In-memory state store for run/attempt lifecycle."""
 from __future__ import annotations
 
+import time
 from collections import OrderedDict
-from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from threading import RLock
 from typing import Any
 
+import orjson
+
 
 def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+_last_timestamp: tuple[int, str] = (0, "")
+
+
+def utcnow_iso() -> str:
+    """Current UTC time as an ISO string with second precision.
+
+    The formatted value is reused for every call within the same wall-clock second.
+    Rebinding the module-level tuple is atomic, so no lock is needed.
+    """
+    global _last_timestamp
+    now = int(time.time())
+    cached = _last_timestamp
+    if cached[0] == now:
+        return cached[1]
+    value = datetime.fromtimestamp(now, timezone.utc).isoformat(timespec="seconds")
+    _last_timestamp = (now, value)
+    return value
+
+
 @dataclass
 class StoreEvent:
     event_type: str
@@ -22,7 +43,14 @@ class StoreEvent:
 
 
 class RunStateStore:
-    """Thread-safe in-memory store for run control plane."""
+    """Thread-safe in-memory store for run control plane.
+
+    Stored jobs are copy-on-write: mutators replace the job dict (and the
+    ``attempts`` tuple) instead of editing it in place, so readers get cheap
+    shallow copies. Values nested inside returned dicts are shared with the
+    store and must be changed through the store API; use ``snapshot`` when an
+    independent deep copy is required.
+    """
 
     def __init__(self, *, max_jobs: int = 500, max_events_per_job: int = 2_000) -> None:
         self._lock = RLock()
@@ -36,7 +64,7 @@ class RunStateStore:
     def put_job(self, job: dict[str, Any]) -> None:
         with self._lock:
             run_id = str(job["run_id"])
-            self._runs[run_id] = job
+            self._runs[run_id] = self._freeze_job(job)
             self._runs.move_to_end(run_id)
             self._evict_runs_if_needed_locked()
 
@@ -45,50 +73,107 @@ class RunStateStore:
             value = self._runs.get(run_id)
             if not value:
                 return None
-            return deepcopy(value)
+            return self._thaw_job(value)
+
+    def snapshot(self, run_id: str) -> dict[str, Any] | None:
+        """Return a fully detached deep copy of the job."""
+
+        with self._lock:
+            value = self._runs.get(run_id)
+            if not value:
+                return None
+            return orjson.loads(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+
+    def get_job_bytes(self, run_id: str) -> bytes | None:
+        """Return a JSON snapshot of the job for callers that only ship it over the wire.
+
+        ``get_job`` remains the API for in-process callers that need a mutable copy.
+        """
+        with self._lock:
+            value = self._runs.get(run_id)
+            if not value:
+                return None
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
 
     def patch_job(self, run_id: str, **changes: Any) -> dict[str, Any] | None:
         with self._lock:
             item = self._runs.get(run_id)
             if not item:
                 return None
-            item.update(changes)
-            item["updated_at"] = utcnow().isoformat()
+            updated = self._freeze_job({**item, **changes, "updated_at": utcnow_iso()})
+            self._runs[run_id] = updated
             self._runs.move_to_end(run_id)
-            return deepcopy(item)
+            return self._thaw_job(updated)
 
     def append_attempt(self, run_id: str, attempt: dict[str, Any]) -> dict[str, Any] | None:
         with self._lock:
             item = self._runs.get(run_id)
             if not item:
                 return None
-            attempts = item.setdefault("attempts", [])
-            attempts.append(attempt)
-            item["updated_at"] = utcnow().isoformat()
+            stored = dict(attempt)
+            self._runs[run_id] = {
+                **item,
+                "attempts": item.get("attempts", ()) + (stored,),
+                "updated_at": utcnow_iso(),
+            }
             self._runs.move_to_end(run_id)
-            return deepcopy(attempt)
+            return dict(stored)
 
     def patch_attempt(self, run_id: str, attempt_id: str, **changes: Any) -> dict[str, Any] | None:
         with self._lock:
             item = self._runs.get(run_id)
             if not item:
                 return None
-            attempts = item.setdefault("attempts", [])
-            for attempt in attempts:
+            attempts = item.get("attempts", ())
+            for position, attempt in enumerate(attempts):
                 if attempt.get("attempt_id") == attempt_id:
-                    attempt.update(changes)
-                    item["updated_at"] = utcnow().isoformat()
+                    patched = {**attempt, **changes}
+                    self._runs[run_id] = {
+                        **item,
+                        "attempts": attempts[:position] + (patched,) + attempts[position + 1 :],
+                        "updated_at": utcnow_iso(),
+                    }
                     self._runs.move_to_end(run_id)
-                    return deepcopy(attempt)
+                    return dict(patched)
             return None
 
+    def patch_attempt_and_event(
+        self,
+        run_id: str,
+        attempt_id: str,
+        *,
+        event_type: str,
+        event_payload: dict[str, Any],
+        **changes: Any,
+    ) -> dict[str, Any] | None:
+        """Apply ``patch_attempt`` and ``append_event`` as one atomic state transition."""
+        with self._lock:
+            patched = self.patch_attempt(run_id, attempt_id, **changes)
+            self.append_event(run_id, event_type, event_payload)
+            return patched
+
     def list_attempts(self, run_id: str) -> list[dict[str, Any]]:
         with self._lock:
             item = self._runs.get(run_id)
             if not item:
                 return []
-            attempts = item.get("attempts", [])
-            return deepcopy(attempts)
+            return [dict(attempt) for attempt in item.get("attempts", ())]
+
+    @staticmethod
+    def _freeze_job(job: dict[str, Any]) -> dict[str, Any]:
+        frozen = dict(job)
+        attempts = frozen.get("attempts")
+        if attempts is not None and not isinstance(attempts, tuple):
+            frozen["attempts"] = tuple(dict(attempt) for attempt in attempts)
+        return frozen
+
+    @staticmethod
+    def _thaw_job(job: dict[str, Any]) -> dict[str, Any]:
+        thawed = dict(job)
+        attempts = thawed.get("attempts")
+        if attempts is not None:
+            thawed["attempts"] = [dict(attempt) for attempt in attempts]
+        return thawed
 
     def append_event(self, run_id: str, event_type: str, payload: dict[str, Any]) -> None:
         with self._lock:
@@ -99,6 +184,21 @@ class RunStateStore:
             if len(events) > self._max_events_per_run:
                 del events[: len(events) - self._max_events_per_run]
 
+    def append_events(self, run_id: str, events: list[tuple[str, dict[str, Any]]]) -> None:
+        """Append several events under one lock, keeping their order and consecutive indexes."""
+        if not events:
+            return
+        with self._lock:
+            stored = self._events.setdefault(run_id, [])
+            event_index = self._next_event_index.get(run_id, 0)
+            stored.extend(
+                StoreEvent(event_type=event_type, payload=payload, index=event_index + offset)
+                for offset, (event_type, payload) in enumerate(events)
+            )
+            self._next_event_index[run_id] = event_index + len(events)
+            if len(stored) > self._max_events_per_run:
+                del stored[: len(stored) - self._max_events_per_run]
+
     def list_events(self, run_id: str, since_index: int = 0) -> tuple[list[dict[str, Any]], int]:
         with self._lock:
             events = self._events.get(run_id, [])
@@ -1,99 +1,208 @@
 """Хранилище индекса шагов Cucumber.
 
 StepIndexStore отвечает за сохранение и загрузку индекса шагов из проекта.
-Текущая реализация использует JSON-файл в каталоге индекса, но интерфейс
-оставлен абстрактным, чтобы в будущем перейти на SQLite или другое хранилище
-без изменения вызывающего кода.
+Базовая реализация использует msgpack-файл в каталоге индекса, а
+SqliteStepIndexStore хранит шаги построчно в SQLite с тем же интерфейсом,
+поэтому вызывающий код не зависит от выбранного хранилища.
 """
 
 from __future__ import annotations
 
-import json
 import hashlib
-from dataclasses import asdict
+import logging
+import os
+import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import msgspec
+import orjson
+
 from domain.enums import StepIntentType, StepKeyword, StepPatternType
 from domain.models import StepDefinition, StepImplementation, StepParameter
 from tools.cucumber_expression import cucumber_expression_to_regex
 
 
+class _StepIndexPayload(msgspec.Struct):
+    """Содержимое файла индекса: шаги хранятся в виде словарей ``_serialize_step``."""
+
+    schema_version: int
+    updated_at: str
+    steps: list[dict[str, Any]]
+
+
+class _StepIndexCount(msgspec.Struct):
+    """Только список шагов без декодирования их содержимого."""
+
+    steps: list[msgspec.Raw]
+
+
+class _StepIndexHeader(msgspec.Struct):
+    """Заголовок индекса; поле ``steps`` при декодировании пропускается."""
+
+    updated_at: str
+
+
+_PAYLOAD_ENCODER = msgspec.msgpack.Encoder()
+_PAYLOAD_DECODER = msgspec.msgpack.Decoder(_StepIndexPayload)
+_HEADER_DECODER = msgspec.msgpack.Decoder(_StepIndexHeader)
+_COUNT_DECODER = msgspec.msgpack.Decoder(_StepIndexCount)
+
+logger = logging.getLogger(__name__)
+
+
 class StepIndexStore:
-    """Хранение индекса шагов в файловой системе (формат JSON)."""
+    """Хранение индекса шагов в файловой системе (формат msgpack).
+
+    Ранее индекс хранился в ``steps.json``; такой файл конвертируется в
+    ``steps.msgpack`` при первой загрузке.
+    """
 
     SCHEMA_VERSION = 3
+    STEPS_FILENAME = "steps.msgpack"
+    LEGACY_STEPS_FILENAME = "steps.json"
 
     def __init__(self, index_dir: str) -> None:
         self._index_dir = Path(index_dir).expanduser().resolve()
         self._index_dir.mkdir(parents=True, exist_ok=True)
+        self._dir_cache: dict[str, Path] = {}
 
     def save_steps(self, project_root: str, steps: list[StepDefinition]) -> None:
         """Сохраняет список шагов для конкретного проекта."""
 
-        target_dir = self._project_dir(project_root)
-        target_dir.mkdir(parents=True, exist_ok=True)
-        payload = {
-            "schema_version": self.SCHEMA_VERSION,
-            "updated_at": datetime.utcnow().isoformat(),
-            "steps": [self._serialize_step(step) for step in steps],
-        }
-        (target_dir / "steps.json").write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
+        self._write_payload(
+            self._project_dir(project_root),
+            [self._serialize_step(step) for step in steps],
+            datetime.utcnow().isoformat(),
         )
 
     def load_steps(self, project_root: str) -> list[StepDefinition]:
         """Загружает сохранённые шаги. Возвращает пустой список, если данных нет."""
 
-        steps_file = self._project_dir(project_root) / "steps.json"
-        if not steps_file.exists():
-            return []
-
-        data = json.loads(steps_file.read_text(encoding="utf-8"))
-        steps_payload = self._extract_steps_payload(data)
+        target_dir = self._project_dir(project_root)
+        steps_file = target_dir / self.STEPS_FILENAME
+        if steps_file.exists():
+            steps_payload = _PAYLOAD_DECODER.decode(steps_file.read_bytes()).steps
+        else:
+            steps_payload = self._migrate_legacy_index(target_dir)
         return [self._deserialize_step(entry) for entry in steps_payload]
 
     def get_last_updated_at(self, project_root: str) -> datetime | None:
         """Возвращает время последнего обновления индекса либо None."""
 
-        steps_file = self._project_dir(project_root) / "steps.json"
-        if not steps_file.exists():
+        target_dir = self._project_dir(project_root)
+        steps_file = target_dir / self.STEPS_FILENAME
+        if steps_file.exists():
+            try:
+                return datetime.fromisoformat(_HEADER_DECODER.decode(steps_file.read_bytes()).updated_at)
+            except (ValueError, msgspec.DecodeError):
+                return None
+
+        legacy_file = target_dir / self.LEGACY_STEPS_FILENAME
+        if not legacy_file.exists():
             return None
 
         try:
-            data = json.loads(steps_file.read_text(encoding="utf-8"))
+            data = orjson.loads(legacy_file.read_bytes())
             timestamp = data.get("updated_at")
             if timestamp:
                 return datetime.fromisoformat(timestamp)
-        except (ValueError, json.JSONDecodeError):
+        except (ValueError, orjson.JSONDecodeError):
             return None
 
-        return datetime.fromtimestamp(steps_file.stat().st_mtime)
+        return datetime.fromtimestamp(legacy_file.stat().st_mtime)
+
+    def count_steps(self) -> int:
+        """Возвращает число шагов во всех проиндексированных проектах.
+
+        Нечитаемые файлы индекса пропускаются с предупреждением.
+        """
+
+        total_steps = 0
+        for project_dir in self._index_dir.iterdir():
+            if not project_dir.is_dir():
+                continue
+            steps_file = project_dir / self.STEPS_FILENAME
+            legacy_file = project_dir / self.LEGACY_STEPS_FILENAME
+            try:
+                if steps_file.exists():
+                    total_steps += len(_COUNT_DECODER.decode(steps_file.read_bytes()).steps)
+                elif legacy_file.exists():
+                    steps_file = legacy_file
+                    total_steps += len(self._extract_steps_payload(orjson.loads(legacy_file.read_bytes())))
+            except (OSError, ValueError, msgspec.DecodeError) as exc:
+                logger.warning("Не удалось прочитать индекс %s: %s", steps_file, exc)
+        return total_steps
 
     def clear(self, project_root: str) -> None:
         """Удаляет сохранённый индекс для указанного проекта, если он существует."""
 
         target_dir = self._project_dir(project_root)
         if target_dir.exists():
-            steps_file = target_dir / "steps.json"
-            if steps_file.exists():
-                steps_file.unlink()
+            for filename in (self.STEPS_FILENAME, self.LEGACY_STEPS_FILENAME):
+                (target_dir / filename).unlink(missing_ok=True)
             try:
                 target_dir.rmdir()
             except OSError:
-                # Папка может содержать другие файлы; удаляем только steps.json
+                # Папка может содержать другие файлы; удаляем только файлы индекса
                 pass
 
+    def close(self) -> None:
+        """Освобождает ресурсы хранилища; файловому индексу закрывать нечего."""
+
+    def _write_payload(self, target_dir: Path, steps: list[dict[str, Any]], updated_at: str) -> None:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        payload = _StepIndexPayload(
+            schema_version=self.SCHEMA_VERSION,
+            updated_at=updated_at,
+            steps=steps,
+        )
+        steps_file = target_dir / self.STEPS_FILENAME
+        tmp_file = steps_file.with_name(f"{steps_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, "wb", buffering=64 * 1024) as handle:
+                handle.write(_PAYLOAD_ENCODER.encode(payload))
+            # Атомарная замена: при сбое посреди записи прежний индекс остаётся целым.
+            os.replace(tmp_file, steps_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    def _migrate_legacy_index(self, target_dir: Path) -> list[dict[str, Any]]:
+        """Переносит ``steps.json`` в msgpack-формат и возвращает его шаги."""
+
+        legacy_file = target_dir / self.LEGACY_STEPS_FILENAME
+        if not legacy_file.exists():
+            return []
+
+        data = orjson.loads(legacy_file.read_bytes())
+        steps_payload = self._extract_steps_payload(data)
+        updated_at = data.get("updated_at") if isinstance(data, dict) else None
+        if not isinstance(updated_at, str) or not updated_at:
+            updated_at = datetime.fromtimestamp(legacy_file.stat().st_mtime).isoformat()
+        self._write_payload(target_dir, steps_payload, updated_at)
+        legacy_file.unlink(missing_ok=True)
+        return steps_payload
+
     def _project_dir(self, project_root: str) -> Path:
         """Возвращает путь к директории индекса для проекта.
 
         Используется хэшированный ключ, чтобы избежать проблем с именами директорий
-        и коллизиями путей.
+        и коллизиями путей. Результат кэшируется по исходной строке пути, чтобы не
+        вызывать ``Path.resolve()`` и SHA-1 на каждом обращении.
         """
 
+        cached = self._dir_cache.get(project_root)
+        if cached is not None:
+            return cached
         project_key = hashlib.sha1(Path(project_root).resolve().as_posix().encode()).hexdigest()
-        return self._index_dir / project_key
+        target = self._index_dir / project_key
+        if Path(project_root).is_absolute():
+            # Относительные пути зависят от текущего каталога, поэтому их не кэшируем.
+            self._dir_cache[project_root] = target
+        return target
 
     @staticmethod
     def _extract_steps_payload(data: dict[str, Any] | list[Any]) -> list[dict[str, Any]]:
@@ -110,15 +219,39 @@ class StepIndexStore:
 
     @staticmethod
     def _serialize_step(step: StepDefinition) -> dict[str, Any]:
-        data = asdict(step)
-        data["keyword"] = step.keyword.value
-        data["pattern_type"] = step.pattern_type.value
-        data["step_type"] = step.step_type.value if step.step_type else None
-        data["parameters"] = [asdict(param) for param in step.parameters]
-        data["implementation"] = (
-            asdict(step.implementation) if step.implementation else None
-        )
-        return data
+        # Явный словарь вместо dataclasses.asdict: asdict рекурсивно глубоко копирует каждое поле.
+        implementation = step.implementation
+        return {
+            "id": step.id,
+            "keyword": step.keyword.value,
+            "pattern": step.pattern,
+            "regex": step.regex,
+            "code_ref": step.code_ref,
+            "pattern_type": step.pattern_type.value,
+            "parameters": [
+                {"name": param.name, "type": param.type, "placeholder": param.placeholder}
+                for param in step.parameters
+            ],
+            "tags": list(step.tags),
+            "language": step.language,
+            "implementation": {
+                "file": implementation.file,
+                "line": implementation.line,
+                "class_name": implementation.class_name,
+                "method_name": implementation.method_name,
+            }
+            if implementation
+            else None,
+            "summary": step.summary,
+            "doc_summary": step.doc_summary,
+            "examples": list(step.examples),
+            "step_type": step.step_type.value if step.step_type else None,
+            "usage_count": step.usage_count,
+            "linked_scenario_ids": list(step.linked_scenario_ids),
+            "sample_scenario_refs": list(step.sample_scenario_refs),
+            "aliases": list(step.aliases),
+            "domain": step.domain,
+        }
 
     @staticmethod
     def _deserialize_step(data: dict[str, Any]) -> StepDefinition:
@@ -163,3 +296,171 @@ class StepIndexStore:
             aliases=list(data.get("aliases", []) or []),
             domain=data.get("domain"),
         )
+
+
+class SqliteStepIndexStore(StepIndexStore):
+    """Хранение индекса шагов в SQLite.
+
+    Каждый шаг хранится отдельной строкой, поэтому повторное сохранение
+    перезаписывает только изменившиеся шаги и удаляет исчезнувшие, а не
+    переписывает весь индекс целиком.
+    """
+
+    DB_FILENAME = "steps.sqlite3"
+
+    def __init__(self, index_dir: str) -> None:
+        super().__init__(index_dir)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self._index_dir / self.DB_FILENAME,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS projects (
+                project_key TEXT PRIMARY KEY,
+                updated_at TEXT NOT NULL,
+                step_order BLOB
+            );
+            CREATE TABLE IF NOT EXISTS steps (
+                project_key TEXT NOT NULL,
+                id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                keyword TEXT NOT NULL,
+                pattern TEXT NOT NULL,
+                regex TEXT,
+                code_ref TEXT NOT NULL,
+                parameters TEXT NOT NULL,
+                tags TEXT NOT NULL,
+                language TEXT,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (project_key, id)
+            );
+            """
+        )
+        project_columns = {row[1] for row in self._conn.execute("PRAGMA table_info(projects)")}
+        if "step_order" not in project_columns:
+            # Базы, созданные до появления step_order, упорядочиваются по position
+            self._conn.execute("ALTER TABLE projects ADD COLUMN step_order BLOB")
+
+    def save_steps(self, project_root: str, steps: list[StepDefinition]) -> None:
+        """Сохраняет шаги проекта одной транзакцией, записывая только изменения."""
+
+        project_key = self._project_key(project_root)
+        rows: dict[str, tuple[Any, ...]] = {}
+        for position, step in enumerate(steps):
+            data = self._serialize_step(step)
+            rows[step.id] = (
+                project_key,
+                step.id,
+                position,
+                data["keyword"],
+                step.pattern,
+                step.regex,
+                step.code_ref,
+                orjson.dumps(data["parameters"]).decode(),
+                orjson.dumps(data["tags"]).decode(),
+                step.language,
+                orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+            )
+
+        with self._lock:
+            existing = dict(
+                self._conn.execute(
+                    "SELECT id, payload FROM steps WHERE project_key = ?",
+                    (project_key,),
+                )
+            )
+            # Порядок шагов хранится в projects.step_order, поэтому сдвиг позиций
+            # не считается изменением и не переписывает строки шагов
+            changed = [row for step_id, row in rows.items() if existing.get(step_id) != row[10]]
+            removed = [(project_key, step_id) for step_id in existing.keys() - rows.keys()]
+            self._conn.execute("BEGIN")
+            try:
+                if removed:
+                    self._conn.executemany(
+                        "DELETE FROM steps WHERE project_key = ? AND id = ?", removed
+                    )
+                if changed:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO steps "
+                        "(project_key, id, position, keyword, pattern, regex, code_ref, "
+                        "parameters, tags, language, payload) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        changed,
+                    )
+                self._conn.execute(
+                    "INSERT INTO projects (project_key, updated_at, step_order) VALUES (?, ?, ?) "
+                    "ON CONFLICT(project_key) DO UPDATE SET "
+                    "updated_at = excluded.updated_at, step_order = excluded.step_order",
+                    (project_key, datetime.utcnow().isoformat(), orjson.dumps(list(rows))),
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def load_steps(self, project_root: str) -> list[StepDefinition]:
+        """Загружает сохранённые шаги в исходном порядке."""
+
+        project_key = self._project_key(project_root)
+        with self._lock:
+            order_row = self._conn.execute(
+                "SELECT step_order FROM projects WHERE project_key = ?", (project_key,)
+            ).fetchone()
+            rows = self._conn.execute(
+                "SELECT id, payload FROM steps WHERE project_key = ? ORDER BY position",
+                (project_key,),
+            ).fetchall()
+        if order_row is not None and order_row[0] is not None:
+            payloads = dict(rows)
+            rows = [
+                (step_id, payloads[step_id])
+                for step_id in orjson.loads(order_row[0])
+                if step_id in payloads
+            ]
+        return [self._deserialize_step(orjson.loads(payload)) for _, payload in rows]
+
+    def get_last_updated_at(self, project_root: str) -> datetime | None:
+        """Возвращает время последнего обновления индекса либо None."""
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated_at FROM projects WHERE project_key = ?",
+                (self._project_key(project_root),),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return datetime.fromisoformat(row[0])
+        except ValueError:
+            return None
+
+    def count_steps(self) -> int:
+        """Возвращает число шагов во всех проиндексированных проектах."""
+
+        with self._lock:
+            (total_steps,) = self._conn.execute("SELECT COUNT(*) FROM steps").fetchone()
+        return total_steps
+
+    def clear(self, project_root: str) -> None:
+        """Удаляет сохранённый индекс для указанного проекта, если он существует."""
+
+        project_key = self._project_key(project_root)
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM steps WHERE project_key = ?", (project_key,))
+            self._conn.execute("DELETE FROM projects WHERE project_key = ?", (project_key,))
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Закрывает соединение с базой."""
+
+        with self._lock:
+            self._conn.close()
+
+    def _project_key(self, project_root: str) -> str:
+        return self._project_dir(project_root).name
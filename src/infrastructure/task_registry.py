@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import uuid
-from copy import deepcopy
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
 from threading import RLock
 from typing import Any, Awaitable, Callable
 
@@ -13,8 +15,24 @@ from typing import Any, Awaitable, Callable
 logger = logging.getLogger(__name__)
 
 
-def _utcnow() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _format_timestamp(value: float) -> str:
+    return _format_second(int(value))
+
+
+@lru_cache(maxsize=1024)
+def _format_second(value: int) -> str:
+    # Second precision lets tasks touched within the same second share one formatted string.
+    return datetime.fromtimestamp(value, timezone.utc).isoformat(timespec="seconds")
+
+
+def _snapshot(entry: dict[str, Any]) -> dict[str, Any]:
+    # Entries hold only scalars plus a flat metadata dict, so one level of copying is enough.
+    # Timestamps are kept as epoch floats and only formatted here, on the (rarer) read path.
+    copied = entry.copy()
+    copied["metadata"] = entry["metadata"].copy()
+    copied["created_at"] = _format_timestamp(entry["created_at"])
+    copied["updated_at"] = _format_timestamp(entry["updated_at"])
+    return copied
 
 
 class TaskRegistry:
@@ -23,8 +41,7 @@ class TaskRegistry:
     def __init__(self, max_entries: int = 512) -> None:
         self._lock = RLock()
         self._max_entries = max(32, max_entries)
-        self._tasks: dict[str, dict[str, Any]] = {}
-        self._order: list[str] = []
+        self._tasks: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
     def create_task(
         self,
@@ -38,18 +55,18 @@ class TaskRegistry:
 
         task_id = str(uuid.uuid4())
         task = asyncio.create_task(coroutine)
+        now = time.time()
         entry = {
             "task_id": task_id,
             "source": source,
             "status": "running",
-            "created_at": _utcnow(),
-            "updated_at": _utcnow(),
+            "created_at": now,
+            "updated_at": now,
             "metadata": dict(metadata or {}),
             "error": None,
         }
         with self._lock:
             self._tasks[task_id] = entry
-            self._order.append(task_id)
             self._trim_locked()
 
         def _done(done_task: asyncio.Task[Any]) -> None:
@@ -69,7 +86,7 @@ class TaskRegistry:
                 item = self._tasks.get(task_id)
                 if item is not None:
                     item["status"] = status
-                    item["updated_at"] = _utcnow()
+                    item["updated_at"] = time.time()
                     item["error"] = error_text
 
             if exc is not None:
@@ -91,25 +108,20 @@ class TaskRegistry:
     def get_task(self, task_id: str) -> dict[str, Any] | None:
         with self._lock:
             item = self._tasks.get(task_id)
-            return deepcopy(item) if item else None
+            return _snapshot(item) if item else None
 
     def list_tasks(self, *, source: str | None = None, limit: int = 100) -> list[dict[str, Any]]:
         bounded = max(1, min(limit, self._max_entries))
         with self._lock:
-            ids = list(reversed(self._order))
             items: list[dict[str, Any]] = []
-            for task_id in ids:
-                item = self._tasks.get(task_id)
-                if not item:
-                    continue
+            for item in reversed(self._tasks.values()):
                 if source and item.get("source") != source:
                     continue
-                items.append(deepcopy(item))
+                items.append(_snapshot(item))
                 if len(items) >= bounded:
                     break
             return items
 
     def _trim_locked(self) -> None:
-        while len(self._order) > self._max_entries:
-            stale_id = self._order.pop(0)
-            self._tasks.pop(stale_id, None)
+        while len(self._tasks) > self._max_entries:
+            self._tasks.popitem(last=False)
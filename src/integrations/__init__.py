@@ -4,11 +4,16 @@ from integrations.jira_testcase_normalizer import (
     normalize_jira_testcase,
     normalize_jira_testcase_to_text,
 )
-from integrations.jira_testcase_provider import JiraTestcaseProvider, extract_jira_testcase_key
+from integrations.jira_testcase_provider import (
+    JiraTestcaseProvider,
+    extract_jira_testcase_key,
+    extract_jira_testcase_keys,
+)
 
 __all__ = [
     "JiraTestcaseProvider",
     "extract_jira_testcase_key",
+    "extract_jira_testcase_keys",
     "normalize_jira_testcase",
     "normalize_jira_testcase_to_text",
 ]
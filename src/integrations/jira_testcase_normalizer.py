@@ -8,11 +8,64 @@ from typing import Any
 from infrastructure.llm_client import LLMClient
 from tools.testcase_step_normalizer import is_table_row, normalize_source_step_text_with_meta
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
 
-_TAG_RE = re.compile(r"<[^>]+>")
-_BR_RE = re.compile(r"<br\s*/?>", re.IGNORECASE)
-_SPACE_RE = re.compile(r"[ \t]+")
+
+_HTML_MARKUP_RE = re.compile(r"(<br\s*/?>)|(</li>)|<[^>]+>", re.IGNORECASE)
+_HTML_MARKUP_REPLACEMENTS = {1: "\n", 2: "; "}
 _SPECIAL_SCENARIO_NAME_KEY = "SCBC-T1"
+_EXPECTED_RESULT_PREFIX = "Ожидаемый результат: "
+_TEST_DATA_PREFIX = "Тестовые данные: "
+
+
+# Comments are dropped like the regex path drops them; script/style text is kept, as there.
+_SKIPPED_HTML_NODES = frozenset({"-comment"})
+
+
+def _replace_html_markup(match: re.Match[str]) -> str:
+    return _HTML_MARKUP_REPLACEMENTS.get(match.lastindex or 0, " ")
+
+
+def _collect_html_text(root: Any, parts: list[str]) -> None:
+    # Explicit stack instead of recursion: deeply nested Jira markup must not hit the recursion
+    # limit. Strings on the stack are separators emitted once an element's children are done.
+    stack: list[Any] = list(root.iter(include_text=True))
+    stack.reverse()
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            parts.append(node)
+            continue
+        tag = node.tag
+        if tag == "-text":
+            parts.append(node.text_content)
+        elif tag == "br":
+            parts.append("\n")
+        elif tag in _SKIPPED_HTML_NODES:
+            parts.append(" ")
+        else:
+            parts.append(" ")
+            stack.append("; " if tag == "li" else " ")
+            children = list(node.iter(include_text=True))
+            children.reverse()
+            stack.extend(children)
+
+
+def _strip_html_markup(raw: str) -> str:
+    """Drops tags and decodes entities, mapping <br> to newlines and list items to '; '."""
+
+    if LexborHTMLParser is None:
+        return html.unescape(_HTML_MARKUP_RE.sub(_replace_html_markup, raw))
+    # The whole document, not just <body>: leading <style>/<title> are parsed into <head>,
+    # and the regex path keeps their text too.
+    root = LexborHTMLParser(raw).root
+    parts: list[str] = []
+    if root is not None:
+        _collect_html_text(root, parts)
+    return "".join(parts)
 
 
 def _clean_html_text(value: Any) -> str:
@@ -20,14 +73,17 @@ def _clean_html_text(value: Any) -> str:
         return ""
 
     raw = str(value)
-    with_breaks = _BR_RE.sub("\n", raw).replace("</li>", "; ")
-    no_tags = _TAG_RE.sub(" ", with_breaks)
-    unescaped = html.unescape(no_tags)
+    # Plain single-line text without markup, entities or runs of whitespace is already clean;
+    # isprintable() rejects tabs, line breaks and every non-ASCII-space separator.
+    if "<" not in raw and "&" not in raw and "  " not in raw and raw.isprintable():
+        return raw.strip()
+
+    unescaped = _strip_html_markup(raw)
     lines = []
     for line in unescaped.splitlines():
-        normalized = _SPACE_RE.sub(" ", line).strip()
-        if normalized:
-            lines.append(normalized)
+        parts = line.split()
+        if parts:
+            lines.append(" ".join(parts))
     return "\n".join(lines)
 
 
@@ -36,15 +92,21 @@ def _sorted_steps(test_script: dict[str, Any]) -> list[dict[str, Any]]:
     if not isinstance(raw_steps, list) or not raw_steps:
         raise ValueError("Jira testcase payload is invalid: missing testScript.steps")
 
-    def _sort_key(item: dict[str, Any]) -> tuple[int, int]:
-        index = item.get("index")
+    # Keys are computed once per step; the running position keeps the sort stable and
+    # guarantees tuple comparison never reaches the step dict itself.
+    decorated: list[tuple[int, int, int, dict[str, Any]]] = []
+    for step in raw_steps:
+        if not isinstance(step, dict):
+            continue
+        index = step.get("index")
         if isinstance(index, int):
-            return index, 0
-        if isinstance(index, str) and index.isdigit():
-            return int(index), 0
-        return 10_000_000, 1
-
-    return sorted((step for step in raw_steps if isinstance(step, dict)), key=_sort_key)
+            decorated.append((index, 0, len(decorated), step))
+        elif isinstance(index, str) and index.isdigit():
+            decorated.append((int(index), 0, len(decorated), step))
+        else:
+            decorated.append((10_000_000, 1, len(decorated), step))
+    decorated.sort()
+    return [item[3] for item in decorated]
 
 
 def normalize_jira_testcase(
@@ -68,8 +130,9 @@ def normalize_jira_testcase(
 
     steps = _sorted_steps(test_script)
 
-    lines: list[str] = [f"Сценарий: {name}"]
-    lines.append("")
+    # Every line is emitted as separate parts followed by "\n" and joined once at the end.
+    parts: list[str] = ["Сценарий: ", name, "\n", "\n"]
+    append = parts.append
     action_number = 1
     normalized_actions = 0
     llm_fallback_used = False
@@ -86,25 +149,32 @@ def normalize_jira_testcase(
         llm_fallback_successful = llm_fallback_successful or bool(meta.get("llmFallbackSuccessful"))
 
         for chunk in normalized_chunks:
+            normalized_actions += 1
             if is_table_row(chunk):
-                lines.append(chunk)
-                normalized_actions += 1
+                append(chunk)
+                append("\n")
                 continue
-            lines.append(f"{action_number}. {chunk}")
+            append(str(action_number))
+            append(". ")
+            append(chunk)
+            append("\n")
             action_number += 1
-            normalized_actions += 1
 
         expected = _clean_html_text(step.get("expectedResult"))
         if expected:
-            lines.append(f"Ожидаемый результат: {expected}")
+            append(_EXPECTED_RESULT_PREFIX)
+            append(expected)
+            append("\n")
 
         test_data = _clean_html_text(step.get("testData"))
         if test_data:
-            lines.append(f"Тестовые данные: {test_data}")
+            append(_TEST_DATA_PREFIX)
+            append(test_data)
+            append("\n")
 
-        lines.append("")
+        append("\n")
 
-    text = "\n".join(lines).strip()
+    text = "".join(parts).strip()
     report = {
         "inputSteps": len(steps),
         "normalizedSteps": normalized_actions,
@@ -1,16 +1,25 @@
 """Jira testcase provider with live and local stub modes."""
 from __future__ import annotations
 
-import copy
-import json
+import mmap
 import re
+import threading
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+from urllib.parse import quote
 
 import httpx
+import orjson
 
 from app.config import Settings, get_settings
 
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None
+
 JIRA_TESTCASE_FIELDS = (
     "id,projectId,archived,key,name,objective,majorVersion,latestVersion,precondition,"
     "folder(id,fullName),status,priority,estimatedTime,averageTime,componentId,owner,labels,"
@@ -20,17 +29,107 @@ JIRA_TESTCASE_FIELDS = (
     "testData,parameters(id,name,defaultValue,index),paramType"
 )
 
-_JIRA_KEY_RE = re.compile(r"\b([A-Z][A-Z0-9]+-[A-Z]*\d+)\b", re.IGNORECASE)
+# Encoded once: commas and parentheses are legal in a query string, so the field list
+# goes on the wire verbatim instead of being percent-encoded by httpx on every request.
+_JIRA_TESTCASE_FIELDS_QUERY = "fields=" + quote(JIRA_TESTCASE_FIELDS, safe=",()")
+
+
+def _testcase_url_template(base_url: str) -> str:
+    """``str.format`` template for a testcase URL; the key is the only placeholder."""
+
+    def _escape(value: str) -> str:
+        return value.replace("{", "{{").replace("}", "}}")
+
+    return f"{_escape(base_url)}/rest/atm/1.0/testcase/{{}}?{_escape(_JIRA_TESTCASE_FIELDS_QUERY)}"
+
+
+_JIRA_KEY_PATTERN = r"\b([A-Z][A-Z0-9]+-[A-Z]*\d+)\b"
+# Matched against upper-cased text, so the pattern itself can stay case-sensitive.
+_JIRA_KEY_RE = re.compile(_JIRA_KEY_PATTERN)
+# Hyperscan prefilter: every key match contains this prefix, and without ``\b`` or ``\d``
+# it does not depend on hyperscan's ASCII-only notion of word characters and digits.
+_JIRA_KEY_PREFILTER = r"[A-Z][A-Z0-9]+-"
 _SPECIAL_STUB_KEY = "SCBC-T1"
 
 
 def extract_jira_testcase_key(text: str | None) -> str | None:
-    if not text:
+    # Every key contains a hyphen; most free-form texts do not, so skip upper() and the regex.
+    if not text or "-" not in text:
         return None
-    match = _JIRA_KEY_RE.search(text)
+    match = _JIRA_KEY_RE.search(text.upper())
     if not match:
         return None
-    return match.group(1).upper()
+    return match.group(1)
+
+
+_hyperscan_db: Any = None
+_hyperscan_lock = threading.Lock()
+
+
+def _get_hyperscan_db() -> Any:
+    global _hyperscan_db
+    if _hyperscan_db is None:
+        with _hyperscan_lock:
+            if _hyperscan_db is None:
+                database = hyperscan.Database()
+                database.compile(
+                    expressions=[_JIRA_KEY_PREFILTER.encode()],
+                    flags=[hyperscan.HS_FLAG_UTF8],
+                )
+                _hyperscan_db = database
+    return _hyperscan_db
+
+
+def extract_jira_testcase_keys(texts: Iterable[str | None]) -> list[str | None]:
+    """Batch variant of ``extract_jira_testcase_key`` returning one key (or None) per text.
+
+    With hyperscan installed all upper-cased texts are scanned in a single pass over a
+    newline-joined buffer for the key prefix, and only texts with a hit go through the
+    ``re`` pattern, so both paths return the same keys (Unicode ``\\b`` and ``\\d``
+    included) whether or not hyperscan is available.
+    """
+
+    items = list(texts)
+    if hyperscan is None:
+        return [extract_jira_testcase_key(text) for text in items]
+
+    upper_texts = [text.upper() if text and "-" in text else "" for text in items]
+    encoded = [text.encode("utf-8") for text in upper_texts]
+    starts: list[int] = []
+    offset = 0
+    for chunk in encoded:
+        starts.append(offset)
+        offset += len(chunk) + 1
+    candidates: set[int] = set()
+
+    def _on_match(_id: int, _start: int, end: int, _flags: int, _context: Any) -> None:
+        candidates.add(bisect_right(starts, end - 1) - 1)
+
+    _get_hyperscan_db().scan(b"\n".join(encoded), match_event_handler=_on_match)
+    keys: list[str | None] = [None] * len(items)
+    for index in candidates:
+        match = _JIRA_KEY_RE.search(upper_texts[index])
+        if match:
+            keys[index] = match.group(1)
+    return keys
+
+
+@lru_cache(maxsize=8)
+def _load_stub_template(path: Path, key: str) -> bytes:
+    """Parse a stub payload file once per process and return it serialized with ``key`` applied.
+
+    Cached at module level so providers constructed per request share one parse.
+    """
+
+    with path.open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            with memoryview(buffer) as view:
+                parsed = orjson.loads(view)
+    if not isinstance(parsed, dict):
+        raise RuntimeError("Jira special stub payload must be a JSON object")
+
+    parsed["key"] = key
+    return orjson.dumps(parsed)
 
 
 class JiraTestcaseProvider:
@@ -46,7 +145,12 @@ class JiraTestcaseProvider:
         self.stub_payload_path = (
             stub_payload_path or Path(__file__).resolve().parent / "stubs" / "jira_testcase_SCBC-T1.json"
         )
-        self._special_stub_payload: dict[str, Any] | None = None
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self._async_client: httpx.AsyncClient | None = None
+        self._timeout = max(1, int(self.settings.jira_request_timeout_s))
+        self._default_base_url = (self.settings.jira_default_instance or "").strip().rstrip("/")
+        self._default_url_template = _testcase_url_template(self._default_base_url)
 
     @property
     def mode(self) -> str:
@@ -70,25 +174,37 @@ class JiraTestcaseProvider:
 
         return self._fetch_live(normalized_key, auth=auth, jira_instance=jira_instance)
 
+    async def fetch_testcase_async(
+        self,
+        key: str,
+        auth: dict[str, Any] | None = None,
+        jira_instance: str | None = None,
+    ) -> dict[str, Any]:
+        """Async counterpart of ``fetch_testcase`` for callers running on an event loop."""
+
+        if not key:
+            raise ValueError("Jira testcase key is empty")
+
+        normalized_key = key.strip().upper()
+        if normalized_key == _SPECIAL_STUB_KEY:
+            return self._fetch_special_stub(normalized_key)
+
+        if self.mode == "disabled":
+            raise RuntimeError("Jira testcase retrieval is disabled")
+
+        url, headers, auth_tuple = self._prepare_live_request(normalized_key, auth=auth, jira_instance=jira_instance)
+        try:
+            response = await self._get_async_client().get(url, headers=headers, auth=auth_tuple)
+        except httpx.HTTPError as exc:
+            raise RuntimeError(f"Jira request failed: {exc}{self._ssl_troubleshooting_hint()}") from exc
+        return self._parse_live_response(response)
+
     def _fetch_special_stub(self, key: str) -> dict[str, Any]:
-        payload = self._load_special_stub_payload()
-        selected = copy.deepcopy(payload)
-        selected["key"] = key
-        return selected
-
-    def _load_special_stub_payload(self) -> dict[str, Any]:
-        if self._special_stub_payload is not None:
-            return self._special_stub_payload
         if not self.stub_payload_path.exists():
             raise RuntimeError(f"Jira stub payload file not found: {self.stub_payload_path}")
-
-        raw = self.stub_payload_path.read_text(encoding="utf-8")
-        parsed = json.loads(raw)
-        if not isinstance(parsed, dict):
-            raise RuntimeError("Jira special stub payload must be a JSON object")
-
-        self._special_stub_payload = parsed
-        return parsed
+        # Re-parsing the pre-serialized template is cheaper than deepcopy and
+        # still hands every caller an independent tree.
+        return orjson.loads(_load_stub_template(self.stub_payload_path, key))
 
     def _fetch_live(
         self,
@@ -97,8 +213,30 @@ class JiraTestcaseProvider:
         auth: dict[str, Any] | None,
         jira_instance: str | None,
     ) -> dict[str, Any]:
-        base_url = (jira_instance or self.settings.jira_default_instance or "").strip().rstrip("/")
-        if not base_url:
+        url, headers, auth_tuple = self._prepare_live_request(key, auth=auth, jira_instance=jira_instance)
+        try:
+            response = self._get_client().get(
+                url,
+                headers=headers,
+                auth=auth_tuple,
+            )
+        except httpx.HTTPError as exc:
+            raise RuntimeError(f"Jira request failed: {exc}{self._ssl_troubleshooting_hint()}") from exc
+        return self._parse_live_response(response)
+
+    def _prepare_live_request(
+        self,
+        key: str,
+        *,
+        auth: dict[str, Any] | None,
+        jira_instance: str | None,
+    ) -> tuple[str, dict[str, str], tuple[str, str] | None]:
+        base_url = (jira_instance or "").strip().rstrip("/")
+        if base_url and base_url != self._default_base_url:
+            url_template = _testcase_url_template(base_url)
+        elif self._default_base_url:
+            url_template = self._default_url_template
+        else:
             raise RuntimeError("Jira instance URL is not configured")
 
         headers: dict[str, str] = {}
@@ -117,28 +255,13 @@ class JiraTestcaseProvider:
                     raise RuntimeError("Jira LOGIN_PASSWORD auth selected but login/password are empty")
                 auth_tuple = (login, password)
 
-        url = f"{base_url}/rest/atm/1.0/testcase/{key}"
-        timeout = max(1, int(self.settings.jira_request_timeout_s))
-        verify: bool | str = True
-        if not self.settings.jira_verify_ssl:
-            verify = False
-        else:
-            ca_bundle = str(self.settings.jira_ca_bundle_file or "").strip()
-            if ca_bundle:
-                verify = ca_bundle
-        try:
-            with httpx.Client(timeout=timeout, follow_redirects=True, verify=verify) as client:
-                response = client.get(
-                    url,
-                    params={"fields": JIRA_TESTCASE_FIELDS},
-                    headers=headers,
-                    auth=auth_tuple,
-                )
-        except httpx.HTTPError as exc:
-            raise RuntimeError(f"Jira request failed: {exc}{self._ssl_troubleshooting_hint()}") from exc
+        return url_template.format(key), headers, auth_tuple
 
+    @staticmethod
+    def _parse_live_response(response: httpx.Response) -> dict[str, Any]:
         if response.status_code >= 400:
-            detail = response.text.strip()
+            # Only the head of the body ends up in the message; skip decoding the rest of large error pages.
+            detail = response.content[:1200].decode("utf-8", errors="replace").strip()
             if len(detail) > 300:
                 detail = detail[:300] + "..."
             raise RuntimeError(
@@ -146,14 +269,67 @@ class JiraTestcaseProvider:
             )
 
         try:
-            payload = response.json()
-        except ValueError as exc:
+            payload = orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
             raise RuntimeError("Jira returned invalid JSON payload") from exc
 
         if not isinstance(payload, dict):
             raise RuntimeError("Jira payload is not a JSON object")
         return payload
 
+    def __enter__(self) -> "JiraTestcaseProvider":
+        return self
+
+    def __exit__(self, _exc_type: Any, _exc: Any, _tb: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close both pooled HTTP clients, if they were opened."""
+
+        self.close()
+        async_client, self._async_client = self._async_client, None
+        if async_client is not None:
+            await async_client.aclose()
+
+    def _get_client(self) -> httpx.Client:
+        client = self._client
+        if client is not None:
+            return client
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(**self._client_options())
+            return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        # Created and used on the caller's event loop, so no lock is needed between check and set.
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(**self._client_options())
+        return self._async_client
+
+    def _client_options(self) -> dict[str, Any]:
+        verify: bool | str = True
+        if not self.settings.jira_verify_ssl:
+            verify = False
+        else:
+            ca_bundle = str(self.settings.jira_ca_bundle_file or "").strip()
+            if ca_bundle:
+                verify = ca_bundle
+        return {
+            "timeout": self._timeout,
+            "follow_redirects": True,
+            "verify": verify,
+            "headers": {"Accept": "application/json"},
+            "limits": httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        }
+
     def _ssl_troubleshooting_hint(self) -> str:
         if not self.settings.jira_verify_ssl:
             return ""
@@ -166,4 +342,9 @@ class JiraTestcaseProvider:
         )
 
 
-__all__ = ["JiraTestcaseProvider", "extract_jira_testcase_key", "JIRA_TESTCASE_FIELDS"]
+__all__ = [
+    "JiraTestcaseProvider",
+    "extract_jira_testcase_key",
+    "extract_jira_testcase_keys",
+    "JIRA_TESTCASE_FIELDS",
+]
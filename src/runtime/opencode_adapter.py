@@ -1,6 +1,7 @@
 """HTTP client for the OpenCode wrapper API."""
 from __future__ import annotations
 
+import json
 from typing import Any
 
 import httpx
@@ -27,6 +28,16 @@ class OpenCodeAdapterError(RuntimeError):
         self.request_id = request_id
 
 
+def _decode_body(body: bytes) -> Any:
+    """Parse a response body once; malformed or empty bodies decode to an empty dict."""
+    if not body:
+        return {}
+    try:
+        return json.loads(body)
+    except ValueError:
+        return {}
+
+
 class HttpOpenCodeAdapterClient:
     def __init__(self, *, base_url: str, timeout_s: float = 30.0) -> None:
         self._base_url = base_url.rstrip("/")
@@ -58,10 +69,8 @@ class HttpOpenCodeAdapterClient:
             ) from exc
 
         request_id = str(response.headers.get("X-Request-Id") or "").strip() or None
-        try:
-            data = response.json() if response.content else {}
-        except Exception:
-            data = {}
+        body = response.content
+        data = _decode_body(body)
 
         if response.is_success:
             if not isinstance(data, dict):
@@ -86,7 +95,8 @@ class HttpOpenCodeAdapterClient:
             )
 
         raise OpenCodeAdapterError(
-            response.text or f"OpenCode adapter request failed: HTTP {response.status_code}",
+            body.decode("utf-8", errors="replace").strip()
+            or f"OpenCode adapter request failed: HTTP {response.status_code}",
             status_code=response.status_code,
             code="backend_unavailable" if response.status_code >= 500 else None,
             retryable=response.status_code >= 500,
@@ -1100,6 +1100,30 @@ class OpenCodeSessionRuntime:
             "lastRetryAt": session.get("last_retry_at"),
         }
 
+    async def batch_get_status(self, session_ids: list[str], *, concurrency: int = 16) -> dict[str, dict[str, Any]]:
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one(session_id: str) -> tuple[str, dict[str, Any]]:
+            async with semaphore:
+                return session_id, await self.get_status(session_id=session_id)
+
+        return dict(await asyncio.gather(*(_one(session_id) for session_id in session_ids)))
+
+    async def batch_get_history(
+        self,
+        session_ids: list[str],
+        *,
+        limit: int = 200,
+        concurrency: int = 16,
+    ) -> dict[str, dict[str, Any]]:
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one(session_id: str) -> tuple[str, dict[str, Any]]:
+            async with semaphore:
+                return session_id, await self.get_history(session_id=session_id, limit=limit)
+
+        return dict(await asyncio.gather(*(_one(session_id) for session_id in session_ids)))
+
     async def get_diff(self, *, session_id: str) -> dict[str, Any]:
         session = self._require_session(session_id)
         try:
@@ -285,6 +285,9 @@ class RunService:
             "run.cancellation_requested",
             {"runId": run_id, "status": next_status},
         )
+        request_cancel = getattr(self._supervisor, "request_cancel", None)
+        if request_cancel is not None:
+            request_cancel(run_id)
         return {
             "run_id": run_id,
             "status": next_status,
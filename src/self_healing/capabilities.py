@@ -6,12 +6,32 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Capability:
     name: str
     handler: Callable[..., Any]
 
 
+_PIPELINE_STRICT_CI: tuple[str, ...] = (
+    "scan_steps",
+    "parse_testcase",
+    "match_steps",
+    "build_feature",
+    "run_test_execution",
+    "collect_run_artifacts",
+    "classify_failure",
+    "apply_remediation",
+    "rerun_with_strategy",
+    "incident_report_builder",
+)
+_PIPELINE_QUICK: tuple[str, ...] = _PIPELINE_STRICT_CI[:7] + ("rerun_with_strategy", "incident_report_builder")
+_PIPELINES: dict[str, tuple[str, ...]] = {
+    "quick": _PIPELINE_QUICK,
+    "strict": _PIPELINE_STRICT_CI,
+    "ci": _PIPELINE_STRICT_CI,
+}
+
+
 class CapabilityRegistry:
     def __init__(self) -> None:
         self._items: dict[str, Capability] = {}
@@ -24,23 +44,5 @@ class CapabilityRegistry:
             raise KeyError(f"Capability is not registered: {name}")
         return self._items[name]
 
-    def build_pipeline(self, profile: str) -> list[str]:
-        common = [
-            "scan_steps",
-            "parse_testcase",
-            "match_steps",
-            "build_feature",
-            "run_test_execution",
-            "collect_run_artifacts",
-            "classify_failure",
-            "apply_remediation",
-            "rerun_with_strategy",
-            "incident_report_builder",
-        ]
-        if profile == "quick":
-            return common[:7] + ["rerun_with_strategy", "incident_report_builder"]
-        if profile == "strict":
-            return common
-        if profile == "ci":
-            return common
-        return common
+    def build_pipeline(self, profile: str) -> tuple[str, ...]:
+        return _PIPELINES.get(profile, _PIPELINE_STRICT_CI)
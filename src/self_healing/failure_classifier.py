@@ -1,11 +1,11 @@
 """Heuristic failure taxonomy classifier."""
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FailureClassificationResult:
     category: str
     confidence: float
@@ -13,33 +13,87 @@ class FailureClassificationResult:
     summary: str
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "category": self.category,
+            "confidence": self.confidence,
+            "signals": list(self.signals),
+            "summary": self.summary,
+        }
+
+
+# Ordered by priority: when tokens of several rules occur, the earliest rule wins.
+_SIGNAL_RULES: tuple[tuple[str, float, str, str, tuple[str, ...]], ...] = (
+    (
+        "infra",
+        0.86,
+        "network_or_infra_signal",
+        "Infrastructure/network instability",
+        ("timeout", "connection reset", "dns", "503", "502"),
+    ),
+    (
+        "product",
+        0.72,
+        "assertion_signal",
+        "Product-level assertion failed",
+        ("assert", "expected", "actual", "mismatch"),
+    ),
+    (
+        "automation",
+        0.74,
+        "ui_automation_signal",
+        "Automation issue while interacting with UI",
+        ("element not found", "stale element", "locator", "ui"),
+    ),
+    (
+        "flaky",
+        0.81,
+        "flaky_signal",
+        "Likely flaky test",
+        ("flaky", "intermittent", "rerun pass", "random"),
+    ),
+    (
+        "data",
+        0.78,
+        "data_signal",
+        "Test data/setup issue",
+        ("seed", "fixture", "test data", "dataset", "not found in db"),
+    ),
+    (
+        "env",
+        0.7,
+        "env_signal",
+        "Environment misconfiguration",
+        ("environment", "config", "permission denied", "missing env"),
+    ),
+)
 
 
 class FailureClassifier:
     taxonomy = ("infra", "env", "data", "flaky", "product", "automation", "unknown")
 
     def classify(self, artifacts: dict[str, str]) -> FailureClassificationResult:
-        text = "\n".join(v for v in artifacts.values() if v).lower()
         signals: list[str] = []
 
-        if any(token in text for token in ("timeout", "connection reset", "dns", "503", "502")):
-            signals.append("network_or_infra_signal")
-            return FailureClassificationResult("infra", 0.86, signals, "Infrastructure/network instability")
-        if any(token in text for token in ("assert", "expected", "actual", "mismatch")):
-            signals.append("assertion_signal")
-            return FailureClassificationResult("product", 0.72, signals, "Product-level assertion failed")
-        if any(token in text for token in ("element not found", "stale element", "locator", "ui")):
-            signals.append("ui_automation_signal")
-            return FailureClassificationResult("automation", 0.74, signals, "Automation issue while interacting with UI")
-        if any(token in text for token in ("flaky", "intermittent", "rerun pass", "random")):
-            signals.append("flaky_signal")
-            return FailureClassificationResult("flaky", 0.81, signals, "Likely flaky test")
-        if any(token in text for token in ("seed", "fixture", "test data", "dataset", "not found in db")):
-            signals.append("data_signal")
-            return FailureClassificationResult("data", 0.78, signals, "Test data/setup issue")
-        if any(token in text for token in ("environment", "config", "permission denied", "missing env")):
-            signals.append("env_signal")
-            return FailureClassificationResult("env", 0.7, signals, "Environment misconfiguration")
+        # `token in text` is a C substring search per token; it beats a combined regex, which
+        # has to try every alternative at every offset of a large log. Artifacts are lowered and
+        # scanned one at a time (no token contains a newline, so this matches scanning the joined
+        # text); later artifacts only try rules above the best hit so far, and once the top rule
+        # matches the rest are never lowered.
+        best = len(_SIGNAL_RULES)
+        for value in artifacts.values():
+            if not value:
+                continue
+            text = value.lower()
+            for rule_index in range(best):
+                if any(token in text for token in _SIGNAL_RULES[rule_index][4]):
+                    best = rule_index
+                    break
+            if best == 0:
+                break
+
+        if best < len(_SIGNAL_RULES):
+            category, confidence, signal, summary, _tokens = _SIGNAL_RULES[best]
+            signals.append(signal)
+            return FailureClassificationResult(category, confidence, signals, summary)
 
         return FailureClassificationResult("unknown", 0.3, signals, "Unable to classify failure confidently")
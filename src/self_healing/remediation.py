@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RemediationDecision:
     action: str
     strategy: str
@@ -21,16 +21,31 @@ class RemediationDecision:
         }
 
 
+# Decisions are immutable, so one shared instance per category is handed out.
+_REMEDIATION_MAP: dict[str, RemediationDecision] = {
+    "infra": RemediationDecision("backoff_retry", "exponential_backoff", True, "Retry after short delay"),
+    "flaky": RemediationDecision("rerun_isolated", "isolation_mode", True, "Rerun in isolated execution mode"),
+    "env": RemediationDecision("env_reset", "safe_reprovision", True, "Safe environment reset requested"),
+    "data": RemediationDecision("data_reset", "safe_seed_rebuild", True, "Restore stable seed/fixtures"),
+    "automation": RemediationDecision("enable_debug", "verbose_logging", True, "Enable verbose logs and diagnostics"),
+}
+_DEFAULT_DECISION = RemediationDecision("manual_attention", "no_auto_action", False, "Requires human review")
+
+# Only infra retries wait before rerunning; the other remediations take effect in-process.
+_BACKOFF_BASE_S = 0.05
+_BACKOFF_MAX_S = 2.0
+
+
 class RemediationPlaybooks:
     def decide(self, category: str) -> RemediationDecision:
-        mapping = {
-            "infra": RemediationDecision("backoff_retry", "exponential_backoff", True, "Retry after short delay"),
-            "flaky": RemediationDecision("rerun_isolated", "isolation_mode", True, "Rerun in isolated execution mode"),
-            "env": RemediationDecision("env_reset", "safe_reprovision", True, "Safe environment reset requested"),
-            "data": RemediationDecision("data_reset", "safe_seed_rebuild", True, "Restore stable seed/fixtures"),
-            "automation": RemediationDecision("enable_debug", "verbose_logging", True, "Enable verbose logs and diagnostics"),
-        }
-        return mapping.get(category, RemediationDecision("manual_attention", "no_auto_action", False, "Requires human review"))
+        return _REMEDIATION_MAP.get(category, _DEFAULT_DECISION)
+
+    def backoff_for(self, decision: RemediationDecision, attempt_index: int) -> float:
+        """Delay in seconds before the rerun that follows attempt ``attempt_index`` (0-based)."""
+
+        if decision.strategy != "exponential_backoff":
+            return 0.0
+        return min(_BACKOFF_BASE_S * (2**attempt_index), _BACKOFF_MAX_S)
 
     def apply(self, decision: RemediationDecision) -> dict[str, Any]:
         if not decision.safe:
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Any
@@ -14,8 +15,24 @@ from self_healing.failure_classifier import FailureClassifier
 from self_healing.remediation import RemediationPlaybooks
 
 
+_second_prefix: tuple[int, str] = (-1, "")
+
+
 def _utcnow() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    """Same string as ``datetime.now(timezone.utc).isoformat()``.
+
+    The ``YYYY-MM-DDTHH:MM:SS`` part is formatted once per wall-clock second and only
+    the microseconds are appended per call.
+    """
+    global _second_prefix
+    seconds, micros = divmod(time.time_ns() // 1_000, 1_000_000)
+    cached = _second_prefix
+    if cached[0] != seconds:
+        cached = (seconds, datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S"))
+        _second_prefix = cached
+    if micros:
+        return f"{cached[1]}.{micros:06d}+00:00"
+    return f"{cached[1]}+00:00"
 
 
 logger = logging.getLogger(__name__)
@@ -38,6 +55,7 @@ class ExecutionSupervisor:
         self.playbooks = RemediationPlaybooks()
         self.max_auto_reruns = max_auto_reruns
         self.max_total_duration_s = max_total_duration_s
+        self._cancel_events: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
 
     def _limits_for_profile(self, profile: str) -> tuple[int, int]:
         normalized = (profile or "quick").strip().lower()
@@ -47,7 +65,28 @@ class ExecutionSupervisor:
             return max(self.max_auto_reruns, 3), max(self.max_total_duration_s, 600)
         return min(self.max_auto_reruns, 1), min(self.max_total_duration_s, 180)
 
+    def request_cancel(self, run_id: str) -> None:
+        """Signal an in-flight run of this process; safe to call from any thread."""
+        entry = self._cancel_events.get(run_id)
+        if entry is None:
+            return
+        loop, event = entry
+        try:
+            same_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            same_loop = False
+        if same_loop:
+            event.set()
+        else:
+            loop.call_soon_threadsafe(event.set)
+
+    def _cancel_signalled(self, run_id: str) -> bool:
+        entry = self._cancel_events.get(run_id)
+        return entry is not None and entry[1].is_set()
+
     def _is_cancellation_requested(self, run_id: str) -> bool:
+        if self._cancel_signalled(run_id):
+            return True
         run_record = self.run_state_store.get_job(run_id)
         if not run_record:
             return True
@@ -57,6 +96,13 @@ class ExecutionSupervisor:
         return status in {"cancelling", "cancelled"}
 
     async def execute_run(self, run_id: str) -> None:
+        self._cancel_events[run_id] = (asyncio.get_running_loop(), asyncio.Event())
+        try:
+            await self._execute_run(run_id)
+        finally:
+            self._cancel_events.pop(run_id, None)
+
+    async def _execute_run(self, run_id: str) -> None:
         run_record = self.run_state_store.get_job(run_id)
         if not run_record:
             return
@@ -82,14 +128,15 @@ class ExecutionSupervisor:
         )
         logger.info("Run running", extra={"runId": run_id, "executionId": execution_id, "profile": profile})
 
-        start = asyncio.get_running_loop().time()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
         succeeded = False
         cancelled = False
         incident: dict[str, Any] | None = None
         latest_result: dict[str, Any] | None = None
 
         for attempt_index in range(max_auto_reruns + 1):
-            if asyncio.get_running_loop().time() - start > max_total_duration_s:
+            if loop.time() - start > max_total_duration_s:
                 incident = self._build_incident(
                     run_record,
                     "",
@@ -101,6 +148,7 @@ class ExecutionSupervisor:
                 break
 
             attempt_id = str(uuid.uuid4())
+            attempt_ctx = {"runId": run_id, "executionId": execution_id, "attemptId": attempt_id}
             self.run_state_store.append_attempt(
                 run_id,
                 {
@@ -115,14 +163,12 @@ class ExecutionSupervisor:
                 run_id,
                 "attempt.started",
                 {
-                    "runId": run_id,
-                    "executionId": execution_id,
-                    "attemptId": attempt_id,
+                    **attempt_ctx,
                     "status": "started",
                 },
             )
 
-            if self._is_cancellation_requested(run_id):
+            if self._cancel_signalled(run_id):
                 self.run_state_store.patch_attempt(
                     run_id,
                     attempt_id,
@@ -136,7 +182,8 @@ class ExecutionSupervisor:
             artifacts: dict[str, str] = {}
             try:
                 with traced_span("run_test_execution"):
-                    result = self.orchestrator.generate_feature(
+                    result = await asyncio.to_thread(
+                        self.orchestrator.generate_feature,
                         run_record["project_root"],
                         run_record["test_case_text"],
                         run_record.get("target_path"),
@@ -158,18 +205,18 @@ class ExecutionSupervisor:
                     )
                 latest_result = result
                 if self._is_cancellation_requested(run_id):
-                    self.run_state_store.patch_attempt(
+                    self.run_state_store.patch_attempt_and_event(
                         run_id,
                         attempt_id,
+                        event_type="attempt.cancelled",
+                        event_payload={
+                            **attempt_ctx,
+                            "status": "cancelled",
+                        },
                         status="cancelled",
                         finished_at=_utcnow(),
                         artifacts=artifacts,
                     )
-                    self.run_state_store.append_event(
-                        run_id,
-                        "attempt.cancelled",
-                        {"runId": run_id, "executionId": execution_id, "attemptId": attempt_id, "status": "cancelled"},
-                    )
                     cancelled = True
                     break
                 feature_payload = result.get("feature", {})
@@ -188,20 +235,17 @@ class ExecutionSupervisor:
                     quality_passed = False
                 has_failure = generation_blocked or (len(unmatched) > 0) or (not quality_passed)
 
-                feature_result_artifact = self.artifact_store.publish_json(
-                    run_id=run_id,
-                    execution_id=execution_id,
-                    attempt_id=attempt_id,
-                    name="feature-result.json",
-                    payload=result,
-                )
-                artifacts["featureResult"] = str(feature_result_artifact["uri"])
+                # The attempt's artifacts are written together in one worker-thread hop right
+                # before the patch that records their URIs; ids are reserved up front so the
+                # classifier can already reference the feature result.
+                feature_result_id = str(uuid.uuid4())
+                attempt_writes = [("featureResult", feature_result_id, "feature-result.json", result)]
                 classifier_input = {
                     "unmatched": str(unmatched),
                     "qualityFailures": str(quality_payload.get("failures", []))
                     if isinstance(quality_payload, dict)
                     else "[]",
-                    "artifactUri": artifacts["featureResult"],
+                    "artifactUri": self.artifact_store.artifact_uri(feature_result_id),
                 }
 
                 if generation_blocked:
@@ -211,25 +255,7 @@ class ExecutionSupervisor:
                         "signals": ["generation_blocked"],
                         "summary": blocking_reason,
                     }
-                    self.run_state_store.patch_attempt(
-                        run_id,
-                        attempt_id,
-                        status="failed",
-                        finished_at=_utcnow(),
-                        classification=classification_payload,
-                        artifacts=artifacts,
-                    )
-                    self.run_state_store.append_event(
-                        run_id,
-                        "attempt.blocked",
-                        {
-                            "runId": run_id,
-                            "executionId": execution_id,
-                            "attemptId": attempt_id,
-                            "status": "failed",
-                            "classification": classification_payload,
-                        },
-                    )
+                    # Built first, so a failed artifact write cannot replace the blocking reason.
                     incident = self._build_incident(
                         run_record,
                         attempt_id,
@@ -238,52 +264,65 @@ class ExecutionSupervisor:
                         classification_payload,
                         blocking_reason,
                     )
+                    artifacts.update(
+                        await self._publish_attempt_artifacts(run_id, execution_id, attempt_id, attempt_writes)
+                    )
+                    self.run_state_store.patch_attempt_and_event(
+                        run_id,
+                        attempt_id,
+                        event_type="attempt.blocked",
+                        event_payload={
+                            **attempt_ctx,
+                            "status": "failed",
+                            "classification": classification_payload,
+                        },
+                        status="failed",
+                        finished_at=_utcnow(),
+                        classification=classification_payload,
+                        artifacts=artifacts,
+                    )
                     break
 
                 if not has_failure:
+                    artifacts.update(
+                        await self._publish_attempt_artifacts(run_id, execution_id, attempt_id, attempt_writes)
+                    )
                     succeeded = True
                     metrics.inc("jobs.succeeded_without_rerun")
-                    self.run_state_store.patch_attempt(
+                    self.run_state_store.patch_attempt_and_event(
                         run_id,
                         attempt_id,
+                        event_type="attempt.succeeded",
+                        event_payload={
+                            **attempt_ctx,
+                            "status": "succeeded",
+                        },
                         status="succeeded",
                         finished_at=_utcnow(),
                         artifacts=artifacts,
                     )
-                    self.run_state_store.append_event(
-                        run_id,
-                        "attempt.succeeded",
-                        {"runId": run_id, "executionId": execution_id, "attemptId": attempt_id, "status": "succeeded"},
-                    )
                     break
 
                 classification = self.classifier.classify(classifier_input)
                 classification_payload = classification.to_dict()
-                classification_artifact = self.artifact_store.publish_json(
-                    run_id=run_id,
-                    execution_id=execution_id,
-                    attempt_id=attempt_id,
-                    name="failure-classification.json",
-                    payload=classification_payload,
+                attempt_writes.append(
+                    ("failureClassification", str(uuid.uuid4()), "failure-classification.json", classification_payload)
                 )
-                artifacts["failureClassification"] = str(classification_artifact["uri"])
-                self.run_state_store.patch_attempt(
-                    run_id,
-                    attempt_id,
-                    status="failed",
-                    classification=classification_payload,
-                    artifacts=artifacts,
+                artifacts.update(
+                    await self._publish_attempt_artifacts(run_id, execution_id, attempt_id, attempt_writes)
                 )
-                self.run_state_store.append_event(
+                self.run_state_store.patch_attempt_and_event(
                     run_id,
-                    "attempt.classified",
-                    {
-                        "runId": run_id,
-                        "executionId": execution_id,
-                        "attemptId": attempt_id,
+                    attempt_id,
+                    event_type="attempt.classified",
+                    event_payload={
+                        **attempt_ctx,
                         "status": "failed",
                         "classification": classification_payload,
                     },
+                    status="failed",
+                    classification=classification_payload,
+                    artifacts=artifacts,
                 )
 
                 if classification.confidence < 0.55:
@@ -304,25 +343,20 @@ class ExecutionSupervisor:
                 decision = self.playbooks.decide(classification.category)
                 remediation_payload = decision.to_dict()
                 apply_result = self.playbooks.apply(decision)
-                self.run_state_store.patch_attempt(
+                self.run_state_store.patch_attempt_and_event(
                     run_id,
                     attempt_id,
-                    status="remediated",
-                    classification=classification_payload,
-                    remediation=remediation_payload,
-                    artifacts=artifacts,
-                )
-                self.run_state_store.append_event(
-                    run_id,
-                    "attempt.remediated",
-                    {
-                        "runId": run_id,
-                        "executionId": execution_id,
-                        "attemptId": attempt_id,
+                    event_type="attempt.remediated",
+                    event_payload={
+                        **attempt_ctx,
                         "status": "remediated",
                         "remediation": remediation_payload,
                         "result": apply_result,
                     },
+                    status="remediated",
+                    classification=classification_payload,
+                    remediation=remediation_payload,
+                    artifacts=artifacts,
                 )
                 if not apply_result.get("applied"):
                     self.run_state_store.patch_attempt(
@@ -339,27 +373,24 @@ class ExecutionSupervisor:
                     )
                     break
 
-                self.run_state_store.patch_attempt(
+                self.run_state_store.patch_attempt_and_event(
                     run_id,
                     attempt_id,
+                    event_type="attempt.rerun_scheduled",
+                    event_payload={
+                        **attempt_ctx,
+                        "status": "rerun_scheduled",
+                    },
                     status="rerun_scheduled",
                     finished_at=_utcnow(),
                     classification=classification_payload,
                     remediation=remediation_payload,
                     artifacts=artifacts,
                 )
-                self.run_state_store.append_event(
-                    run_id,
-                    "attempt.rerun_scheduled",
-                    {
-                        "runId": run_id,
-                        "executionId": execution_id,
-                        "attemptId": attempt_id,
-                        "status": "rerun_scheduled",
-                    },
-                )
                 metrics.inc("jobs.rerun_scheduled")
-                await asyncio.sleep(0.05)
+                delay = self.playbooks.backoff_for(decision, attempt_index)
+                if delay:
+                    await asyncio.sleep(delay)
             except Exception as exc:
                 classification_result = self.classifier.classify({"exception": str(exc)})
                 classification_payload = classification_result.to_dict()
@@ -371,9 +402,13 @@ class ExecutionSupervisor:
                     classification=classification_payload,
                     artifacts=artifacts,
                 )
-                incident = self._build_incident(
-                    run_record, attempt_id, run_id, execution_id, classification_payload, str(exc)
-                )
+                if incident is None:
+                    incident = self._build_incident(
+                        run_record, attempt_id, run_id, execution_id, classification_payload, str(exc)
+                    )
+                else:
+                    # This attempt already stopped for a reason of its own; keep it and attach the error.
+                    incident["errors"] = [str(exc)]
                 break
 
         if cancelled:
@@ -381,23 +416,27 @@ class ExecutionSupervisor:
         else:
             final_status = "succeeded" if succeeded else "needs_attention"
         metrics.inc(f"jobs.final_status.{final_status}")
+        # Terminal events are written together, after the run record reaches its final status.
+        final_events: list[tuple[str, dict[str, Any]]] = []
         incident_uri = None
         if incident and final_status != "cancelled":
-            incident_artifact = self.artifact_store.publish_incident(
+            incident_artifact = await asyncio.to_thread(
+                self.artifact_store.publish_incident,
                 run_id=run_id,
                 execution_id=execution_id,
                 payload=incident,
             )
             incident_uri = str(incident_artifact["uri"])
-            self.run_state_store.append_event(
-                run_id,
-                "run.incident",
-                {
-                    "runId": run_id,
-                    "executionId": execution_id,
-                    "incident": incident,
-                    "incidentUri": incident_uri,
-                },
+            final_events.append(
+                (
+                    "run.incident",
+                    {
+                        "runId": run_id,
+                        "executionId": execution_id,
+                        "incident": incident,
+                        "incidentUri": incident_uri,
+                    },
+                )
             )
 
         feature_result = (
@@ -413,26 +452,52 @@ class ExecutionSupervisor:
             result=feature_result,
         )
         if final_status == "cancelled":
-            self.run_state_store.append_event(
-                run_id,
-                "run.cancelled",
-                {"runId": run_id, "executionId": execution_id, "status": "cancelled"},
+            final_events.append(
+                ("run.cancelled", {"runId": run_id, "executionId": execution_id, "status": "cancelled"})
+            )
+        final_events.append(
+            (
+                "run.finished",
+                {
+                    "runId": run_id,
+                    "executionId": execution_id,
+                    "status": final_status,
+                    "incidentUri": incident_uri,
+                    "resultReady": bool(feature_result),
+                },
             )
-        self.run_state_store.append_event(
-            run_id,
-            "run.finished",
-            {
-                "runId": run_id,
-                "executionId": execution_id,
-                "status": final_status,
-                "incidentUri": incident_uri,
-                "resultReady": bool(feature_result),
-            },
         )
+        self.run_state_store.append_events(run_id, final_events)
 
     async def execute_job(self, run_id: str) -> None:
         await self.execute_run(run_id)
 
+    async def _publish_attempt_artifacts(
+        self,
+        run_id: str,
+        execution_id: str,
+        attempt_id: str,
+        writes: list[tuple[str, str, str, Any]],
+    ) -> dict[str, str]:
+        """Publishes an attempt's JSON artifacts in one worker thread and returns key -> URI."""
+
+        def _publish_all() -> dict[str, str]:
+            return {
+                key: str(
+                    self.artifact_store.publish_json(
+                        run_id=run_id,
+                        execution_id=execution_id,
+                        attempt_id=attempt_id,
+                        name=name,
+                        payload=payload,
+                        artifact_id=artifact_id,
+                    )["uri"]
+                )
+                for key, artifact_id, name, payload in writes
+            }
+
+        return await asyncio.to_thread(_publish_all)
+
     @staticmethod
     def _build_incident(
         run_record: dict[str, Any],
@@ -466,22 +531,21 @@ class ExecutionSupervisor:
             for entry in unmapped_steps_raw
         ]
 
+        # ``seen_ids.add`` returns None, so the last clause records the id and keeps the first occurrence.
         seen_ids: set[str] = set()
-        used_steps: list[dict[str, Any]] = []
-        for item in match_payload.get("matched", []):
-            if not isinstance(item, dict):
-                continue
-            if item.get("status") == "unmatched":
-                continue
-            step_definition = item.get("step_definition")
-            if not isinstance(step_definition, dict):
-                continue
-            step_id = str(step_definition.get("id", ""))
-            if not step_id or step_id in seen_ids:
-                continue
-            seen_ids.add(step_id)
-            used_steps.append(step_definition)
+        used_steps: list[dict[str, Any]] = [
+            step_definition
+            for item in match_payload.get("matched", [])
+            if isinstance(item, dict)
+            and item.get("status") != "unmatched"
+            and isinstance(step_definition := item.get("step_definition"), dict)
+            and (step_id := str(step_definition.get("id", "")))
+            and not (step_id in seen_ids or seen_ids.add(step_id))
+        ]
 
+        meta = feature_payload.get("meta")
+        meta_values = meta or {}
+        quality = feature_payload.get("quality")
         return {
             "featureText": feature_payload.get("featureText", ""),
             "unmappedSteps": unmapped_steps,
@@ -491,18 +555,18 @@ class ExecutionSupervisor:
             "stepsSummary": feature_payload.get("stepsSummary"),
             "stepDetails": feature_payload.get("stepDetails", []),
             "parameterFillSummary": feature_payload.get("parameterFillSummary", {}),
-            "meta": feature_payload.get("meta"),
-            "quality": feature_payload.get("quality"),
+            "meta": meta,
+            "quality": quality,
             "coverageReport": feature_payload.get("coverageReport"),
             "pipeline": result.get("pipeline", []),
             "fileStatus": result.get("fileStatus"),
-            "planId": (feature_payload.get("meta") or {}).get("planId"),
-            "selectedScenarioId": (feature_payload.get("meta") or {}).get("selectedScenarioId"),
-            "selectedScenarioCandidateId": (feature_payload.get("meta") or {}).get("selectedScenarioCandidateId"),
-            "generationBlocked": bool((feature_payload.get("meta") or {}).get("generationBlocked", False)),
+            "planId": meta_values.get("planId"),
+            "selectedScenarioId": meta_values.get("selectedScenarioId"),
+            "selectedScenarioCandidateId": meta_values.get("selectedScenarioCandidateId"),
+            "generationBlocked": bool(meta_values.get("generationBlocked", False)),
             "warnings": [
                 str(item.get("code"))
-                for item in (feature_payload.get("quality") or {}).get("warnings", [])
+                for item in (quality or {}).get("warnings", [])
                 if isinstance(item, dict) and item.get("code")
             ],
         }
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 
 _TYPE_MAP: dict[str, str] = {
@@ -19,18 +20,39 @@ _TYPE_MAP: dict[str, str] = {
 _PLACEHOLDER_RE = re.compile(r"\{([^{}]*)\}")
 
 
+@lru_cache(maxsize=4096)
+def _escape_literal(literal: str) -> str:
+    """``re.escape`` для литерального фрагмента; короткие фрагменты повторяются между шагами."""
+
+    return re.escape(literal)
+
+
+@lru_cache(maxsize=8192)
 def cucumber_expression_to_regex(pattern: str) -> str:
-    """Преобразует Cucumber Expression в регулярное выражение."""
+    """Преобразует Cucumber Expression в регулярное выражение.
+
+    Чистая функция: результат кэшируется по строке выражения.
+    """
 
     parts: list[str] = []
+    # Локальные ссылки дешевле глобальных поисков внутри цикла.
+    append = parts.append
+    escape = _escape_literal
+    type_regex = _TYPE_MAP.get
     last_end = 0
     for match in _PLACEHOLDER_RE.finditer(pattern):
-        literal = pattern[last_end : match.start()]
-        parts.append(re.escape(literal))
+        append(escape(pattern[last_end : match.start()]))
         placeholder = match.group(1).strip()
         type_name = placeholder.split(":")[-1].strip().casefold() or "string"
-        parts.append(_TYPE_MAP.get(type_name, r"(.+?)"))
+        append(type_regex(type_name, r"(.+?)"))
         last_end = match.end()
 
-    parts.append(re.escape(pattern[last_end:]))
+    append(escape(pattern[last_end:]))
     return f"^{''.join(parts)}$"
+
+
+@lru_cache(maxsize=8192)
+def cucumber_expression_compiled(pattern: str) -> re.Pattern[str]:
+    """Возвращает скомпилированное регулярное выражение для Cucumber Expression."""
+
+    return re.compile(cucumber_expression_to_regex(pattern))
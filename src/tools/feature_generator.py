@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+from typing import Any, Iterator
 
 from domain.enums import MatchStatus, StepKeyword
 from domain.models import FeatureFile, FeatureScenario, MatchedStep, Scenario, localize_gherkin_keyword
 from tools.testcase_step_normalizer import is_table_row, parse_normalization_section
 
+_PLACEHOLDER_RE = re.compile(r"\{[^}]+\}")
+_TMS_LINK_PREFIX = "tmslink="
+_GENERATED_LINE_RE = re.compile(r"^\s*(\S+)(\s+.*)?$")
+
 
 class FeatureGenerator:
     """Builds FeatureFile and renders final Gherkin text."""
@@ -21,34 +25,33 @@ class FeatureGenerator:
         matched_steps: list[MatchedStep],
         language: str | None = None,
     ) -> FeatureFile:
-        self.language = language or "ru"
+        language = self.language = language or "ru"
         feature_tags, scenario_tags = self._resolve_feature_and_scenario_tags(scenario.tags)
         feature = FeatureFile(
             name=scenario.name or "Feature",
             description=scenario.description or scenario.expected_result,
-            language=self.language,
+            language=language,
             tags=feature_tags,
             background_steps=[],
             scenarios=[],
         )
 
-        scenario_steps: list[str] = []
-        steps_details: list[dict[str, Any]] = []
-        for matched_step in matched_steps:
-            rendered, meta = self._render_step(matched_step, self.language)
-            scenario_steps.append(rendered)
-            binding_status = self._binding_status(matched_step)
-            evidence_refs = self._evidence_refs(matched_step)
-            step_payload: dict[str, Any] = {
+        # The language is fixed for the whole feature, so keywords are localized once up front.
+        keywords = {keyword: keyword.as_text(language) for keyword in StepKeyword}
+        rendered_steps = [self._render_step(matched_step, keywords) for matched_step in matched_steps]
+        scenario_steps = [rendered for rendered, _meta in rendered_steps]
+        steps_details: list[dict[str, Any]] = [
+            {
                 "originalStep": matched_step.test_step.text,
                 "generatedLine": rendered,
                 "status": matched_step.status.value,
-                "bindingStatus": binding_status,
-                "evidenceRefs": evidence_refs,
+                # _render_step already resolved both into every meta branch.
+                "bindingStatus": meta["bindingStatus"],
+                "evidenceRefs": meta["evidenceRefs"],
+                "meta": meta,
             }
-            if meta:
-                step_payload["meta"] = meta
-            steps_details.append(step_payload)
+            for matched_step, (rendered, meta) in zip(matched_steps, rendered_steps)
+        ]
 
         feature_scenario = FeatureScenario(
             name=scenario.name,
@@ -63,59 +66,57 @@ class FeatureGenerator:
 
     @staticmethod
     def _resolve_feature_and_scenario_tags(tags: list[str]) -> tuple[list[str], list[str]]:
-        tms_prefix = "TmsLink="
-        tms_value = next(
-            (
-                str(tag).strip()
-                for tag in tags
-                if str(tag).strip().lower().startswith(tms_prefix.lower())
-                and str(tag).strip()[len(tms_prefix) :]
-            ),
-            None,
-        )
-        if not tms_value:
-            return list(tags), list(tags)
-
-        testcase_key = tms_value[len(tms_prefix) :]
-        return [testcase_key], [tms_value]
+        prefix_length = len(_TMS_LINK_PREFIX)
+        for tag in tags:
+            candidate = str(tag).strip()
+            if len(candidate) > prefix_length and candidate[:prefix_length].casefold() == _TMS_LINK_PREFIX:
+                return [candidate[prefix_length:]], [candidate]
+        return list(tags), list(tags)
 
     def render_feature(self, feature: FeatureFile) -> str:
-        lines: list[str] = []
-        if feature.language:
-            lines.append(f"# language: {feature.language}")
+        # Trim trailing whitespace on the line list so the text is built by a single join,
+        # instead of join + rstrip + concat each copying the whole feature.
+        lines = list(self._iter_feature_lines(feature))
+        while lines and not lines[-1].strip():
+            lines.pop()
+        if not lines:
+            return "\n"
+        lines[-1] = lines[-1].rstrip()
+        lines.append("")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _iter_feature_lines(feature: FeatureFile) -> Iterator[str]:
+        language = feature.language
+        if language:
+            yield f"# language: {language}"
 
         if feature.tags:
-            lines.append(" ".join(f"@{tag}" for tag in feature.tags))
+            yield " ".join(f"@{tag}" for tag in feature.tags)
 
-        feature_keyword = localize_gherkin_keyword("Feature", feature.language)
-        lines.append(f"{feature_keyword}: {feature.name}")
+        yield f"{localize_gherkin_keyword('Feature', language)}: {feature.name}"
 
         if feature.description:
-            lines.append("")
-            lines.append(feature.description)
+            yield ""
+            yield feature.description
 
         if feature.background_steps:
-            lines.append("")
-            background_keyword = localize_gherkin_keyword("Background", feature.language)
-            lines.append(f"  {background_keyword}:")
-            for step in feature.background_steps:
-                lines.append(f"    {step}")
+            yield ""
+            yield f"  {localize_gherkin_keyword('Background', language)}:"
+            yield from (f"    {step}" for step in feature.background_steps)
 
+        scenario_keyword = localize_gherkin_keyword("Scenario", language)
         for scenario in feature.scenarios:
-            lines.append("")
+            yield ""
             if scenario.tags:
-                lines.append(" ".join(f"@{tag}" for tag in scenario.tags))
-            scenario_keyword = localize_gherkin_keyword("Scenario", feature.language)
-            lines.append(f"  {scenario_keyword}: {scenario.name}")
-            for step in scenario.steps:
-                lines.append(f"    {step}")
-
-        return "\n".join(lines).rstrip() + "\n"
+                yield " ".join(f"@{tag}" for tag in scenario.tags)
+            yield f"  {scenario_keyword}: {scenario.name}"
+            yield from (f"    {step}" for step in scenario.steps)
 
     def _render_step(
         self,
         matched_step: MatchedStep,
-        language: str | None,
+        keywords: dict[StepKeyword, str],
     ) -> tuple[str, dict[str, Any]]:
         binding_status = self._binding_status(matched_step)
         evidence_refs = self._evidence_refs(matched_step)
@@ -133,7 +134,7 @@ class FeatureGenerator:
 
         if matched_step.generated_gherkin_line:
             return (
-                self._localize_generated_line(matched_step.generated_gherkin_line, language),
+                self._localize_generated_line(matched_step.generated_gherkin_line, keywords),
                 self._with_normalization_meta(
                     {
                         "substitutionType": "generated",
@@ -146,7 +147,7 @@ class FeatureGenerator:
             )
 
         if matched_step.resolved_step_text:
-            keyword = self._select_keyword(matched_step, language)
+            keyword = self._select_keyword(matched_step, keywords)
             line = f"{keyword} {matched_step.resolved_step_text}".strip()
             meta: dict[str, Any] = {
                 "substitutionType": "resolved",
@@ -172,7 +173,7 @@ class FeatureGenerator:
             if isinstance(matched_step.notes, dict):
                 reason = matched_step.notes.get("reason")
             marker = reason or binding_status or "unmatched"
-            line = f"{StepKeyword.WHEN.as_text(language)} <{marker}: {matched_step.test_step.text}>"
+            line = f"{keywords[StepKeyword.WHEN]} <{marker}: {matched_step.test_step.text}>"
             meta: dict[str, Any] = {
                 "substitutionType": "unmatched",
                 "renderSource": "unmatched",
@@ -183,59 +184,62 @@ class FeatureGenerator:
                 meta["reason"] = reason
             return line, self._with_normalization_meta(meta, matched_step)
 
-        rendered, meta = self._build_gherkin_line(matched_step, language)
+        rendered, meta = self._build_gherkin_line(matched_step, keywords)
         meta["bindingStatus"] = binding_status
         meta["evidenceRefs"] = evidence_refs
         return rendered, self._with_normalization_meta(meta, matched_step)
 
-    def _localize_generated_line(self, line: str, language: str | None) -> str:
-        match = re.match(r"^\s*(\S+)(\s+.*)?$", line)
+    def _localize_generated_line(self, line: str, keywords: dict[StepKeyword, str]) -> str:
+        # Lines that already start with a target-language keyword come back unchanged.
+        if line and not line[0].isspace() and line.split(None, 1)[0] in keywords.values():
+            return line
+        match = _GENERATED_LINE_RE.match(line)
         if not match:
             return line
 
         keyword = match.group(1)
         rest = match.group(2) or ""
         try:
-            normalized_keyword = StepKeyword.from_string(keyword).as_text(language)
+            normalized_keyword = keywords[StepKeyword.from_string(keyword)]
         except ValueError:
             return line
 
         return f"{normalized_keyword}{rest}"
 
-    def _select_keyword(self, matched_step: MatchedStep, language: str | None) -> str:
+    def _select_keyword(self, matched_step: MatchedStep, keywords: dict[StepKeyword, str]) -> str:
         definition = matched_step.step_definition
         if definition and isinstance(definition.keyword, StepKeyword):
-            return definition.keyword.as_text(language)
-        return StepKeyword.WHEN.as_text(language)
+            return keywords[definition.keyword]
+        return keywords[StepKeyword.WHEN]
 
     def _build_gherkin_line(
         self,
         matched_step: MatchedStep,
-        language: str | None,
+        keywords: dict[StepKeyword, str],
     ) -> tuple[str, dict[str, Any]]:
         definition = matched_step.step_definition
         if not definition:
             return "", {"substitutionType": "unmatched"}
 
-        keyword = self._select_keyword(matched_step, language)
+        keyword = self._select_keyword(matched_step, keywords)
         pattern = definition.pattern
-        regex = definition.regex
 
         filled_pattern = pattern
-        try:
-            match = re.search(regex, matched_step.test_step.text)
-        except re.error:
-            match = None
+        compiled = definition.compiled_regex
+        match = compiled.search(matched_step.test_step.text) if compiled is not None else None
 
         substitution_type = "pattern"
         if match:
             groups = match.groups()
-            placeholders = re.findall(r"\{[^}]+\}", pattern)
-            if groups and placeholders:
-                for placeholder, value in zip(placeholders, groups):
-                    filled_pattern = filled_pattern.replace(placeholder, value, 1)
-            elif groups:
-                filled_pattern = " ".join([pattern] + list(groups))
+            if groups:
+                # One pass over the pattern: each placeholder takes the next group, extra ones stay as-is.
+                values = iter(groups)
+                filled_pattern, placeholder_count = _PLACEHOLDER_RE.subn(
+                    lambda placeholder: next(values, placeholder.group(0)),
+                    pattern,
+                )
+                if not placeholder_count:
+                    filled_pattern = " ".join([pattern] + list(groups))
             substitution_type = "regex"
 
         rendered = f"{keyword} {filled_pattern}" if filled_pattern else keyword
@@ -245,7 +249,7 @@ class FeatureGenerator:
 
     @staticmethod
     def _has_placeholders(text: str) -> bool:
-        return bool(re.search(r"\{[^}]+\}", text))
+        return _PLACEHOLDER_RE.search(text) is not None
 
     @staticmethod
     def _with_normalization_meta(
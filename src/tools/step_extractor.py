@@ -1,9 +1,15 @@
 ﻿"""РР·РІР»РµС‡РµРЅРёРµ Cucumber-С€Р°РіРѕРІ РёР· РёСЃС…РѕРґРЅС‹С… С„Р°Р№Р»РѕРІ С‚РµСЃС‚РѕРІРѕРіРѕ С„СЂРµР№РјРІРѕСЂРєР°."""
 from __future__ import annotations
 
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from functools import lru_cache, partial
+from multiprocessing import get_context
+from typing import Iterable, Iterator, List, Sequence
 
 from domain.enums import StepKeyword, StepPatternType
 from domain.models import StepDefinition, StepImplementation, StepParameter
@@ -11,13 +17,46 @@ from infrastructure.fs_repo import FsRepository
 from tools.cucumber_expression import cucumber_expression_to_regex
 
 
-_SUPPORTED_KEYWORDS_PATTERN = "|".join(
-    re.escape(keyword) for keyword in sorted(StepKeyword.supported_keywords(), key=len, reverse=True)
-)
+# Any "@Name("...")" is matched generically; the keyword is then validated with one dict lookup
+# instead of a long case-insensitive alternation tried at every "@".
+# String bodies are "unrolled" quote-free runs (no lazy ".+?" + backreference), so unterminated
+# strings fail in linear time. Kotlin raw strings ("""...""") are matched whole.
 _ANNOTATION_RE = re.compile(
-    rf"@\s*({_SUPPORTED_KEYWORDS_PATTERN})\s*\(\s*([\"\'])(.+?)\2\s*\)",
-    re.IGNORECASE,
+    r"@\s*(\w+)\s*\(\s*"
+    r"(?:\"\"\"([^\"]*(?:\"(?!\"\")[^\"]*)*)\"\"\"|\"([^\"\\]*(?:\\.[^\"\\]*)*)\"|'([^'\\]*(?:\\.[^'\\]*)*)')"
+    r"\s*\)"
+)
+_ANNOTATION_KEYWORDS: dict[str, StepKeyword] = {
+    keyword.casefold(): StepKeyword.from_string(keyword) for keyword in StepKeyword.supported_keywords()
+}
+_CLASS_RE = re.compile(r"\b(class|object)\s+(?P<name>[A-Za-z_][\w]*)")
+_METHOD_RE = re.compile(
+    r"(?:\bfun\s+)?(?P<name>[A-Za-z_][\w]*)\s*\((?P<params>[^)]*)\)",
+    re.UNICODE,
 )
+_NON_WORD_RE = re.compile(r"\W+")
+# A spawned worker spends ~0.2-0.4 s importing this module while serial parsing costs ~0.8 ms
+# per file, so a worker only pays off with several hundred files of its own.
+_PARALLEL_MIN_FILES = 512
+# Parsed annotations per file keyed by (absolute path, st_mtime_ns, st_size); rescans skip unchanged files.
+_FILE_CACHE_MAX_ENTRIES = 4096
+_file_cache: OrderedDict[tuple[str, int, int], tuple[ExtractedAnnotation, ...]] = OrderedDict()
+_file_cache_lock = threading.Lock()
+# Lines without braces, "@" or class/object never change brace depth or the class stack,
+# so one scan over the whole file yields just the lines worth visiting (".*" eats the rest of the line).
+_LINE_EVENT_RE = re.compile(r"(?:[{}@]|\b(?:class|object)\b).*")
+_PLACEHOLDER_TYPES: dict[str, str] = {
+    "int": "int",
+    "integer": "int",
+    "float": "float",
+    "double": "double",
+    "word": "word",
+    "string": "string",
+    "byte": "byte",
+    "short": "short",
+    "long": "long",
+    "bigdecimal": "bigdecimal",
+}
 
 
 @dataclass
@@ -55,8 +94,12 @@ class StepExtractor:
         self,
         fs_repo: FsRepository,
         patterns: List[str] | None = None,
+        max_workers: int = 0,
     ) -> None:
         self.fs_repo = fs_repo
+        # Opt-in: workers use the spawn start method, so the calling program must guard its
+        # entry point with `if __name__ == "__main__":` or the pool breaks on start-up.
+        self.max_workers = max_workers
         self.patterns = patterns or [
             "**/*Steps.java",
             "**/*Steps.kt",
@@ -75,52 +118,67 @@ class StepExtractor:
     def extract_steps(self) -> list[StepDefinition]:
         """РџСЂРѕС…РѕРґРёС‚ РїРѕ РёСЃС…РѕРґРЅРёРєР°Рј Рё РІРѕР·РІСЂР°С‰Р°РµС‚ СЃРїРёСЃРѕРє РЅР°Р№РґРµРЅРЅС‹С… С€Р°РіРѕРІ."""
 
-        steps: list[StepDefinition] = []
-        for relative_path in self.fs_repo.iter_source_files(self.patterns):
-            content = self.fs_repo.read_text_file(relative_path)
-            annotations = list(self._iter_annotations(content.splitlines()))
-            for annotation in annotations:
-                step_id = f"{relative_path}:{annotation.line_number}"
-                pattern_type = self._detect_pattern_type(annotation.pattern)
-                regex = (
-                    cucumber_expression_to_regex(annotation.pattern)
-                    if pattern_type is StepPatternType.CUCUMBER_EXPRESSION
-                    else annotation.pattern
-                )
-                steps.append(
-                    StepDefinition(
-                        id=step_id,
-                        keyword=annotation.keyword,
-                        pattern=annotation.pattern,
-                        regex=regex,
-                        code_ref=step_id,
-                        pattern_type=pattern_type,
-                        parameters=self._extract_parameters(
-                            annotation.pattern,
-                            pattern_type,
-                            annotation.method_parameters,
-                        ),
-                        tags=[],
-                        language=None,
-                        implementation=StepImplementation(
-                            file=str(relative_path),
-                            line=annotation.line_number,
-                            class_name=annotation.class_name,
-                            method_name=annotation.method_name,
-                        ),
-                    )
-                )
-        return steps
+        return list(self.iter_steps())
+
+    def iter_steps(self) -> Iterator[StepDefinition]:
+        """Yields step definitions file by file, in the same order as extract_steps."""
+
+        relative_paths = list(self.fs_repo.iter_source_files(self.patterns))
+        root_path = self.fs_repo.get_root_path()
+        entries: list[tuple[str, tuple[str, int, int], tuple[ExtractedAnnotation, ...] | None]] = []
+        for relative_path in relative_paths:
+            stat = self.fs_repo.stat(relative_path)
+            key = (f"{root_path}/{relative_path}", stat.st_mtime_ns, stat.st_size)
+            with _file_cache_lock:
+                annotations = _file_cache.get(key)
+                if annotations is not None:
+                    _file_cache.move_to_end(key)
+            entries.append((relative_path, key, annotations))
+
+        misses = [relative_path for relative_path, _, annotations in entries if annotations is None]
+        extract_file = partial(_extract_file_annotations, self.fs_repo)
+        workers = min(self.max_workers, os.cpu_count() or 1, len(misses) // _PARALLEL_MIN_FILES)
+        if workers < 2:
+            yield from self._build_steps(entries, map(extract_file, misses))
+            return
+        # spawn, not fork: the scanner runs inside a threaded server process.
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+            parsed = executor.map(extract_file, misses, chunksize=_PARALLEL_MIN_FILES // 2)
+            yield from self._build_steps(entries, parsed)
+
+    @staticmethod
+    def _build_steps(
+        entries: Sequence[tuple[str, tuple[str, int, int], tuple[ExtractedAnnotation, ...] | None]],
+        parsed: Iterator[tuple[ExtractedAnnotation, ...]],
+    ) -> Iterator[StepDefinition]:
+        """Builds fresh step definitions in file order, storing newly parsed files in the cache."""
+
+        for relative_path, key, annotations in entries:
+            if annotations is None:
+                annotations = next(parsed)
+                with _file_cache_lock:
+                    _file_cache[key] = annotations
+                    if len(_file_cache) > _FILE_CACHE_MAX_ENTRIES:
+                        _file_cache.popitem(last=False)
+            # Callers mutate returned steps, so only the parsed annotations are shared.
+            yield from _build_file_steps(relative_path, annotations)
 
     @staticmethod
     def _iter_annotations(lines: Iterable[str]) -> Iterable[ExtractedAnnotation]:
         """РќР°С…РѕРґРёС‚ Р°РЅРЅРѕС‚Р°С†РёРё С€Р°РіРѕРІ РїРѕ СЃС‚СЂРѕРєР°Рј С„Р°Р№Р»Р° Рё РѕРєСЂСѓР¶РµРЅРёРµ РєР»Р°СЃСЃР°/РјРµС‚РѕРґР°."""
 
         normalized_lines = list(lines)
+        text = "\n".join(normalized_lines)
         class_stack: list[tuple[str, int]] = []  # (class_name, depth_at_open)
         pending_class: str | None = None
         brace_depth = 0
-        for idx, line in enumerate(normalized_lines, start=1):
+        line_index = 0
+        scanned_to = 0
+        for event in _LINE_EVENT_RE.finditer(text):
+            line_index += text.count("\n", scanned_to, event.start())
+            scanned_to = event.start()
+            idx = line_index + 1
+            line = normalized_lines[line_index]
             open_braces = line.count("{")
             close_braces = line.count("}")
 
@@ -128,7 +186,7 @@ class StepExtractor:
                 class_stack.append((pending_class, brace_depth + open_braces))
                 pending_class = None
 
-            class_match = re.search(r"\b(class|object)\s+(?P<name>[A-Za-z_][\w]*)", line)
+            class_match = _CLASS_RE.search(line)
             if class_match:
                 class_name = class_match.group("name")
                 if open_braces:
@@ -136,10 +194,9 @@ class StepExtractor:
                 else:
                     pending_class = class_name
 
-            match = _ANNOTATION_RE.search(line)
-            if match:
-                raw_keyword, _, pattern = match.groups()
-                annotation_keyword = StepKeyword.from_string(raw_keyword)
+            step_annotation = _match_step_annotation(line) if "@" in line else None
+            if step_annotation:
+                annotation_keyword, pattern = step_annotation
                 method_name, method_params = StepExtractor._find_method_context(
                     normalized_lines, idx
                 )
@@ -163,28 +220,25 @@ class StepExtractor:
     ) -> tuple[str | None, list[tuple[str | None, str | None]]]:
         """РС‰РµС‚ РѕР±СЉСЏРІР»РµРЅРёРµ РјРµС‚РѕРґР° РІ РЅРµСЃРєРѕР»СЊРєРёС… СЃР»РµРґСѓСЋС‰РёС… СЃС‚СЂРѕРєР°С…."""
 
-        METHOD_RE = re.compile(
-            r"(?:\bfun\s+)?(?P<name>[A-Za-z_][\w]*)\s*\((?P<params>[^)]*)\)",
-            re.UNICODE,
-        )
         parameters: list[tuple[str | None, str | None]] = []
-        signature = ""
-        started = False
-        for line in lines[start_index - 1 : start_index + 20]:
+        signature_parts: list[str] = []
+        signature_closed = False
+        for line_index in range(start_index - 1, min(len(lines), start_index + 20)):
+            line = lines[line_index]
             stripped = line.strip()
             if not stripped:
                 continue
-            if _ANNOTATION_RE.search(line):
+            if "@" in line and _match_step_annotation(line):
                 continue
 
-            if "(" in stripped:
-                started = True
-            if started:
-                signature = f"{signature} {stripped}".strip()
+            if signature_parts or "(" in stripped:
+                signature_parts.append(stripped)
+                signature_closed = signature_closed or ")" in stripped
 
-            method_match = METHOD_RE.search(signature if started else stripped)
+            # _METHOD_RE needs both parentheses: until ")" shows up there is nothing to search.
+            method_match = _METHOD_RE.search(" ".join(signature_parts)) if signature_closed else None
             if not method_match:
-                if started and "{" in stripped:
+                if signature_parts and "{" in stripped:
                     break
                 continue
             method_name = method_match.group("name")
@@ -215,14 +269,19 @@ class StepExtractor:
         return parameters
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def _detect_pattern_type(pattern: str) -> StepPatternType:
         """РћРїСЂРµРґРµР»СЏРµС‚ С‚РёРї РїР°С‚С‚РµСЂРЅР° С€Р°РіР°."""
 
-        stripped = pattern.strip()
-        if stripped.startswith("^") or re.search(r"\\.|\[|\]|\(\?|\$", pattern):
+        if (
+            pattern.lstrip().startswith("^")
+            or "\\" in pattern
+            or "[" in pattern
+            or "]" in pattern
+            or "(?" in pattern
+            or "$" in pattern
+        ):
             return StepPatternType.REGULAR_EXPRESSION
-        if "{" in pattern and "}" in pattern:
-            return StepPatternType.CUCUMBER_EXPRESSION
         return StepPatternType.CUCUMBER_EXPRESSION
 
     @staticmethod
@@ -234,67 +293,72 @@ class StepExtractor:
         """РР·РІР»РµРєР°РµС‚ РїР°СЂР°РјРµС‚СЂС‹ С€Р°РіР° СЃ РёРјРµРЅР°РјРё, С‚РёРїР°РјРё Рё РїР»РµР№СЃС…РѕР»РґРµСЂР°РјРё."""
 
         method_parameters = method_parameters or []
-        if pattern_type is StepPatternType.CUCUMBER_EXPRESSION:
-            raw_parameters = StepExtractor._parse_cucumber_placeholders(pattern)
-        else:
-            raw_parameters = StepExtractor._parse_regex_groups(pattern)
-
         parameters: list[StepParameter] = []
-        for idx, raw in enumerate(raw_parameters):
+        for idx, (raw_name, raw_type, placeholder) in enumerate(
+            StepExtractor._raw_parameters(pattern, pattern_type)
+        ):
             method_param = method_parameters[idx] if idx < len(method_parameters) else (None, None)
-            name = method_param[0] or raw.get("name") or f"group{idx + 1}"
-            param_type = raw.get("type") or method_param[1]
+            name = method_param[0] or raw_name or f"group{idx + 1}"
+            param_type = raw_type or method_param[1]
             parameters.append(
                 StepParameter(
                     name=name,
                     type=param_type,
-                    placeholder=raw.get("placeholder"),
+                    placeholder=placeholder,
                 )
             )
         return parameters
 
     @staticmethod
-    def _parse_cucumber_placeholders(pattern: str) -> list[dict[str, str | None]]:
+    @lru_cache(maxsize=8192)
+    def _raw_parameters(
+        pattern: str, pattern_type: StepPatternType
+    ) -> tuple[tuple[str | None, str | None, str | None], ...]:
+        """(name, type, placeholder) per pattern parameter; identical annotations across a repo parse once."""
+
+        if pattern_type is StepPatternType.CUCUMBER_EXPRESSION:
+            return tuple(StepExtractor._parse_cucumber_placeholders(pattern))
+        return tuple(StepExtractor._parse_regex_groups(pattern))
+
+    @staticmethod
+    def _parse_cucumber_placeholders(pattern: str) -> list[tuple[str | None, str | None, str]]:
         """РР·РІР»РµРєР°РµС‚ РїР»РµР№СЃС…РѕР»РґРµСЂС‹ Cucumber Expression Рё РёС… С‚РёРїС‹."""
 
-        type_map = {
-            "int": "int",
-            "integer": "int",
-            "float": "float",
-            "double": "double",
-            "word": "word",
-            "string": "string",
-            "byte": "byte",
-            "short": "short",
-            "long": "long",
-            "bigdecimal": "bigdecimal",
-        }
-
-        parameters: list[dict[str, str | None]] = []
-        for idx, match in enumerate(re.finditer(r"\{([^{}]*)\}", pattern), start=1):
-            placeholder = match.group(0)
-            content = match.group(1).strip()
+        parameters: list[tuple[str | None, str | None, str]] = []
+        idx = 0
+        start = pattern.find("{")
+        while start != -1:
+            end = pattern.find("}", start + 1)
+            if end == -1:
+                break
+            # "{a {b}" -> only the innermost "{b}" is a placeholder.
+            inner_start = pattern.rfind("{", start + 1, end)
+            if inner_start != -1:
+                start = inner_start
+                continue
+            idx += 1
+            placeholder = pattern[start : end + 1]
+            start = pattern.find("{", end + 1)
+            content = placeholder[1:-1].strip()
             normalized = content.split(":")[-1].strip().casefold()
             if not normalized:
                 normalized = "string"
-            inferred_type = type_map.get(normalized)
-            sanitized_name = re.sub(r"\W+", "_", content).strip("_") or None
+            inferred_type = _PLACEHOLDER_TYPES.get(normalized)
+            # Typical placeholders ("int", "string") are already word-only: skip the regex for them.
+            if content.isalnum():
+                sanitized_name = content
+            else:
+                sanitized_name = _NON_WORD_RE.sub("_", content).strip("_") or None
             name = sanitized_name or (f"arg{idx}" if inferred_type else None)
-            parameters.append(
-                {
-                    "name": name,
-                    "type": inferred_type,
-                    "placeholder": placeholder,
-                }
-            )
+            parameters.append((name, inferred_type, placeholder))
         return parameters
 
     @staticmethod
-    def _parse_regex_groups(pattern: str) -> list[dict[str, str | None]]:
+    def _parse_regex_groups(pattern: str) -> list[tuple[str | None, None, str]]:
         """Extracts named and positional capturing groups from a regex pattern."""
 
-        parameters: list[dict[str, str | None]] = []
-        stack: list[dict[str, int | bool | str | None]] = []
+        parameters: list[tuple[str | None, None, str]] = []
+        stack: list[tuple[int, bool, str | None]] = []  # (start, capturing, name)
         escaped = False
         in_char_class = False
         i = 0
@@ -335,24 +399,77 @@ class StepExtractor:
                             capturing = True
                     else:
                         capturing = False
-                stack.append({"start": i, "capturing": capturing, "name": name})
+                stack.append((i, capturing, name))
                 i += 1
                 continue
 
             if ch == ")" and stack:
-                group = stack.pop()
-                if group.get("capturing"):
-                    start = int(group["start"])
-                    parameters.append(
-                        {
-                            "name": str(group.get("name")) if group.get("name") else None,
-                            "placeholder": pattern[start : i + 1],
-                            "type": None,
-                        }
-                    )
+                start, capturing, name = stack.pop()
+                if capturing:
+                    parameters.append((name or None, None, pattern[start : i + 1]))
                 i += 1
                 continue
 
             i += 1
         return parameters
 
+
+def _match_step_annotation(line: str) -> tuple[StepKeyword, str] | None:
+    """First step annotation on the line as (keyword, pattern); other annotations are skipped."""
+
+    match = _ANNOTATION_RE.search(line)
+    while match:
+        keyword = _ANNOTATION_KEYWORDS.get(match.group(1).casefold())
+        pattern = match.group(2) or match.group(3) or match.group(4)
+        if keyword is not None and pattern:
+            return keyword, pattern
+        match = _ANNOTATION_RE.search(line, match.end())
+    return None
+
+
+def _extract_file_annotations(fs_repo: FsRepository, relative_path: str) -> tuple[ExtractedAnnotation, ...]:
+    """Parses step annotations from one source file (module-level so worker processes can pickle it)."""
+
+    # Without "@" there is no annotation to find, so skip reading and decoding the file.
+    if not fs_repo.file_contains(relative_path, b"@"):
+        return ()
+    content = fs_repo.read_text_file(relative_path)
+    return tuple(StepExtractor._iter_annotations(content.splitlines()))
+
+
+def _build_file_steps(relative_path: str, annotations: Iterable[ExtractedAnnotation]) -> list[StepDefinition]:
+    """Builds step definitions for one file from its parsed annotations."""
+
+    steps: list[StepDefinition] = []
+    for annotation in annotations:
+        step_id = f"{relative_path}:{annotation.line_number}"
+        pattern_type = StepExtractor._detect_pattern_type(annotation.pattern)
+        regex = (
+            cucumber_expression_to_regex(annotation.pattern)
+            if pattern_type is StepPatternType.CUCUMBER_EXPRESSION
+            else annotation.pattern
+        )
+        steps.append(
+            StepDefinition(
+                id=step_id,
+                keyword=annotation.keyword,
+                pattern=annotation.pattern,
+                regex=regex,
+                code_ref=step_id,
+                pattern_type=pattern_type,
+                parameters=StepExtractor._extract_parameters(
+                    annotation.pattern,
+                    pattern_type,
+                    annotation.method_parameters,
+                ),
+                tags=[],
+                language=None,
+                implementation=StepImplementation(
+                    file=str(relative_path),
+                    line=annotation.line_number,
+                    class_name=annotation.class_name,
+                    method_name=annotation.method_name,
+                ),
+            )
+        )
+    return steps
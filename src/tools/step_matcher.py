@@ -38,6 +38,9 @@ class StepMatcher:
     """Step matcher with deterministic ranking and ambiguity-gated LLM rerank."""
 
     _CUCUMBER_PLACEHOLDER_RE = re.compile(r"\{[^{}]*\}")
+    _QUOTED_VALUE_RE = re.compile(r'"([^"]+)"|\'([^\']+)\'|«([^»]+)»')
+    _NUMERIC_VALUE_RE = re.compile(r"-?\d+(?:[.,]\d+)?")
+    _NUMERIC_PLACEHOLDER_TYPES = frozenset({"int", "integer", "float", "double", "byte", "short", "long", "bigdecimal"})
     _LEADING_GHERKIN_KEYWORD_RE = re.compile(
         r"^\s*(?P<keyword>Дано|Когда|Тогда|И|Но|Given|When|Then|And|But)\b\s*(?P<text>.+)$",
         re.IGNORECASE,
@@ -639,13 +642,10 @@ class StepMatcher:
         *,
         source: str = "regex_strict",
     ) -> tuple[str, list[dict[str, Any]], str, str] | None:
-        regex = definition.regex
-        if not regex:
-            return None
-        try:
-            match = re.search(regex, test_text)
-        except re.error:
+        if not definition.regex:
             return None
+        compiled = definition.compiled_regex
+        match = compiled.search(test_text) if compiled is not None else None
         if not match:
             return None
 
@@ -672,13 +672,15 @@ class StepMatcher:
 
     @staticmethod
     def _has_placeholders(text: str) -> bool:
-        return bool(StepMatcher._CUCUMBER_PLACEHOLDER_RE.search(text))
+        return StepMatcher._CUCUMBER_PLACEHOLDER_RE.search(text) is not None
 
     def _replace_placeholders(self, pattern: str, values: list[str]) -> str:
-        filled = pattern
-        for placeholder, value in zip(self._extract_placeholders(pattern), values):
-            filled = filled.replace(placeholder, self._clean_value(value), 1)
-        return filled
+        # One pass: each placeholder takes the next value, extra placeholders stay as-is.
+        cleaned = iter([self._clean_value(value) for value in values])
+        return self._CUCUMBER_PLACEHOLDER_RE.sub(
+            lambda placeholder: next(cleaned, placeholder.group(0)),
+            pattern,
+        )
 
     def _build_parameter_payload(
         self,
@@ -782,16 +784,16 @@ class StepMatcher:
 
         quoted_values = [
             self._clean_value(match.group(1) or match.group(2) or match.group(3))
-            for match in re.finditer(r'"([^"]+)"|\'([^\']+)\'|«([^»]+)»', text)
+            for match in self._QUOTED_VALUE_RE.finditer(text)
         ]
-        numeric_values = re.findall(r"-?\d+(?:[.,]\d+)?", text)
+        numeric_values = self._NUMERIC_VALUE_RE.findall(text)
 
         result: list[str] = []
         quoted_idx = 0
         numeric_idx = 0
         for placeholder in placeholders:
             placeholder_type = placeholder.strip("{} ").casefold()
-            if placeholder_type in {"int", "integer", "float", "double", "byte", "short", "long", "bigdecimal"}:
+            if placeholder_type in self._NUMERIC_PLACEHOLDER_TYPES:
                 if numeric_idx < len(numeric_values):
                     result.append(self._clean_value(numeric_values[numeric_idx]))
                     numeric_idx += 1
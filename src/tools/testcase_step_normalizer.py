@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from domain.models import TestStep
 from infrastructure.llm_client import LLMClient
@@ -40,7 +42,9 @@ def build_normalization_section(
     return _NORMALIZATION_SECTION_PREFIX + json.dumps(payload, ensure_ascii=False)
 
 
-def parse_normalization_section(section: str | None) -> dict[str, Any] | None:
+@lru_cache(maxsize=1024)
+def parse_normalization_section(section: str | None) -> Mapping[str, Any] | None:
+    """Decode (and cache) normalization meta; the result is a read-only view."""
     if not section or not section.startswith(_NORMALIZATION_SECTION_PREFIX):
         return None
     raw = section[len(_NORMALIZATION_SECTION_PREFIX) :]
@@ -50,7 +54,7 @@ def parse_normalization_section(section: str | None) -> dict[str, Any] | None:
         return None
     if not isinstance(payload, dict):
         return None
-    return payload
+    return MappingProxyType(payload)
 
 
 def normalize_source_step_text(
@@ -125,3 +125,10 @@ def test_artifact_storage_backend_validation() -> None:
 def test_s3_artifact_storage_requires_bucket() -> None:
     with pytest.raises(ValueError, match="artifact_s3_bucket"):
         Settings(_env_file=None, artifact_storage_backend="s3", artifact_s3_bucket=None)
+
+
+def test_steps_index_backend_accepts_json_as_deprecated_msgpack_alias() -> None:
+    assert Settings(_env_file=None, steps_index_backend="json").steps_index_backend == "msgpack"
+    assert Settings(_env_file=None, steps_index_backend="sqlite").steps_index_backend == "sqlite"
+    with pytest.raises(ValueError, match="msgpack, sqlite"):
+        Settings(_env_file=None, steps_index_backend="yaml")
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import pytest
+
+from agents import _serialize_matched_step, _serialize_scenario
+from agents.feature_builder_agent import FeatureBuilderAgent
 from domain.enums import MatchStatus, StepKeyword
 from domain.models import MatchedStep, Scenario, StepDefinition, TestStep
 from tools.feature_generator import FeatureGenerator
@@ -80,3 +84,115 @@ def test_feature_generator_maps_tmslink_tag_to_feature_and_scenario_tags() -> No
 
     assert "\n@SCBC-T3280\nFeature: Jira scenario\n" in rendered
     assert "\n@TmsLink=SCBC-T3280\n  Scenario: Jira scenario\n" in rendered
+
+
+def test_feature_generator_fills_pattern_placeholders_from_definition_regex() -> None:
+    definition = StepDefinition(
+        id="1",
+        keyword=StepKeyword.WHEN,
+        pattern="user enters {string} into {word} field",
+        regex=r"^user enters \"?([^\"\n]+)\"? into (\w+) field$",
+        code_ref="steps.input",
+    )
+    broken = StepDefinition(
+        id="2",
+        keyword=StepKeyword.THEN,
+        pattern="result is {int}",
+        regex=r"result is (\d+",
+        code_ref="steps.broken",
+    )
+    steps = [
+        TestStep(order=1, text='user enters "admin" into login field'),
+        TestStep(order=2, text="result is 5"),
+    ]
+    matched = [
+        MatchedStep(test_step=steps[0], status=MatchStatus.EXACT, step_definition=definition),
+        MatchedStep(test_step=steps[1], status=MatchStatus.FUZZY, step_definition=broken),
+    ]
+    scenario = Scenario(name="Placeholders", description=None, steps=steps, tags=[])
+
+    feature = FeatureGenerator().build_feature(scenario, matched, language="en")
+    details = feature.scenarios[0].steps_details
+
+    assert feature.scenarios[0].steps == ["When user enters admin into login field", "Then result is {int}"]
+    assert details[0]["meta"]["substitutionType"] == "regex"
+    assert details[0]["meta"]["parameterFillStatus"] == "full"
+    assert details[1]["meta"]["substitutionType"] == "pattern"
+    assert details[1]["meta"]["parameterFillStatus"] == "partial"
+
+
+def test_feature_generator_fills_repeated_placeholders_in_order() -> None:
+    definition = StepDefinition(
+        id="1",
+        keyword=StepKeyword.GIVEN,
+        pattern="{word} transfers {int} to {word}",
+        regex=r"^(\w+) transfers (\d+) to (\w+)$",
+        code_ref="steps.transfer",
+    )
+    no_placeholders = StepDefinition(
+        id="2",
+        keyword=StepKeyword.THEN,
+        pattern="balance is",
+        regex=r"^balance is (\d+)$",
+        code_ref="steps.balance",
+    )
+    steps = [TestStep(order=1, text="alice transfers 10 to bob"), TestStep(order=2, text="balance is 7")]
+    matched = [
+        MatchedStep(test_step=steps[0], status=MatchStatus.EXACT, step_definition=definition),
+        MatchedStep(test_step=steps[1], status=MatchStatus.EXACT, step_definition=no_placeholders),
+    ]
+    scenario = Scenario(name="Transfers", description=None, steps=steps, tags=[])
+
+    feature = FeatureGenerator().build_feature(scenario, matched, language="en")
+
+    assert feature.scenarios[0].steps == ["Given alice transfers 10 to bob", "Then balance is 7"]
+
+
+def test_feature_generator_tmslink_tag_resolution_edge_cases() -> None:
+    resolve = FeatureGenerator._resolve_feature_and_scenario_tags
+
+    assert resolve(["smoke", " tmslink=ABC-1 ", "TmsLink=XYZ-2"]) == (["ABC-1"], ["tmslink=ABC-1"])
+    assert resolve(["TmsLink=", "regress"]) == (["TmsLink=", "regress"], ["TmsLink=", "regress"])
+    assert resolve([]) == ([], [])
+
+
+def test_feature_builder_agent_reuses_result_for_identical_inputs(monkeypatch) -> None:
+    definition = StepDefinition(
+        id="1",
+        keyword=StepKeyword.GIVEN,
+        pattern="data is prepared",
+        regex=r"data is prepared",
+        code_ref="steps.setup",
+    )
+    test_step = TestStep(order=1, text="data is prepared")
+    matched = MatchedStep(
+        test_step=test_step,
+        status=MatchStatus.EXACT,
+        step_definition=definition,
+        resolved_step_text="data is prepared",
+    )
+    scenario = Scenario(name="Cached", description=None, steps=[test_step], tags=[])
+    agent = FeatureBuilderAgent()
+    scenario_dict = _serialize_scenario(scenario)
+    matched_dicts = [_serialize_matched_step(matched)]
+
+    first = agent.build_feature_from_matches(scenario_dict, matched_dicts, language="en")
+    monkeypatch.setattr(agent.generator, "build_feature", lambda *_args, **_kwargs: pytest.fail("rebuilt"))
+    second = agent.build_feature_from_matches(scenario_dict, matched_dicts, language="en")
+
+    assert second == first
+    second["stepDetails"].clear()
+    assert agent.build_feature_from_matches(scenario_dict, matched_dicts, language="en") == first
+    with pytest.raises(pytest.fail.Exception, match="rebuilt"):
+        agent.build_feature_from_matches(scenario_dict, matched_dicts, language="ru")
+
+
+def test_feature_generator_localizes_generated_lines() -> None:
+    generator = FeatureGenerator()
+    keywords = {keyword: keyword.as_text("ru") for keyword in StepKeyword}
+
+    assert generator._localize_generated_line("Когда открыт экран", keywords) == "Когда открыт экран"
+    assert generator._localize_generated_line("  Given screen is open", keywords) == "Дано screen is open"
+    assert generator._localize_generated_line("когда открыт экран", keywords) == "Когда открыт экран"
+    assert generator._localize_generated_line("Unknown words", keywords) == "Unknown words"
+    assert StepKeyword.from_string(" Допустим ") is StepKeyword.GIVEN
@@ -9,7 +9,7 @@ sys.path.append(str(PROJECT_ROOT / "src"))
 
 from domain.enums import MatchStatus, StepKeyword, StepPatternType
 from domain.models import MatchedStep, Scenario, StepDefinition, TestStep
-from tools.cucumber_expression import cucumber_expression_to_regex
+from tools.cucumber_expression import cucumber_expression_compiled, cucumber_expression_to_regex
 from tools.feature_generator import FeatureGenerator
 from tools.step_matcher import StepMatcher
 
@@ -180,6 +180,15 @@ def test_cucumber_expression_converts_anonymous_placeholder_to_capture_group() -
     assert re.search(regex, "авторизуемся клиентом ООО Ромашка в МП СБОЛ")
 
 
+def test_cucumber_expression_compiled_is_memoized() -> None:
+    pattern = "пользователь вводит {int} в поле {word}"
+    compiled = cucumber_expression_compiled(pattern)
+
+    assert compiled is cucumber_expression_compiled(pattern)
+    assert compiled.pattern == cucumber_expression_to_regex(pattern)
+    assert compiled.search("пользователь вводит 42 в поле логин").groups() == ("42", "логин")
+
+
 def test_matcher_exposes_parameters_for_anonymous_cucumber_placeholder() -> None:
     definition = StepDefinition(
         id="anonymous-1",
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
+import httpx
 import pytest
 
+import integrations.jira_testcase_normalizer as jira_normalizer_module
 import integrations.jira_testcase_provider as jira_provider_module
 from agents.orchestrator import Orchestrator
 from app.config import Settings
 from integrations.jira_testcase_normalizer import normalize_jira_testcase, normalize_jira_testcase_to_text
-from integrations.jira_testcase_provider import JiraTestcaseProvider, extract_jira_testcase_key
+from integrations.jira_testcase_provider import (
+    JIRA_TESTCASE_FIELDS,
+    JiraTestcaseProvider,
+    extract_jira_testcase_key,
+    extract_jira_testcase_keys,
+)
 
 
 class _RepoScannerStub:
@@ -113,6 +121,28 @@ def _make_orchestrator(*, parser: _ParserStub, jira_provider: Any) -> Orchestrat
 def test_extract_jira_testcase_key_from_free_form_text() -> None:
     assert extract_jira_testcase_key("please generate autotest for scbc-t1") == "SCBC-T1"
     assert extract_jira_testcase_key("plain text without key") is None
+    assert extract_jira_testcase_key("step-by-step without digits") is None
+    assert extract_jira_testcase_key("ticket\u2011less SCBC-T12") == "SCBC-T12"
+
+
+def test_extract_jira_testcase_keys_matches_single_extraction() -> None:
+    texts = [
+        "please generate autotest for scbc-t1",
+        "plain text without key",
+        None,
+        "см. ABC-12 и потом XYZ-T7\nещё строка",
+        "",
+        "tail key PROJ-42",
+    ]
+    assert extract_jira_testcase_keys(texts) == [extract_jira_testcase_key(text) for text in texts]
+    assert extract_jira_testcase_keys(texts) == ["SCBC-T1", None, None, "ABC-12", None, "PROJ-42"]
+
+
+def test_extract_jira_testcase_keys_respects_unicode_neighbours() -> None:
+    texts = ["ЖABC-1", "ABC-1Ж", "ÉABC-2 и XYZ-3", "«ABC-4»", "ABC-١٢", "ſcbc-t1", "ключ—ABC-5—тут"]
+    expected = [extract_jira_testcase_key(text) for text in texts]
+    assert expected == [None, None, "XYZ-3", "ABC-4", "ABC-١٢", "SCBC-T1", "ABC-5"]
+    assert extract_jira_testcase_keys(texts) == expected
 
 
 def test_normalize_jira_testcase_sorts_steps_and_strips_html() -> None:
@@ -138,6 +168,28 @@ def test_normalize_jira_testcase_sorts_steps_and_strips_html() -> None:
     assert "<strong>" not in normalized
 
 
+def test_normalize_jira_testcase_renders_exact_layout() -> None:
+    payload = {
+        "name": "Demo",
+        "testScript": {
+            "steps": [
+                {"index": 0, "description": "Open app", "expectedResult": "Opened", "testData": "user=a"},
+                {"index": 1, "description": "Close app"},
+            ]
+        },
+    }
+
+    normalized = normalize_jira_testcase_to_text(payload)
+
+    assert normalized == (
+        "Сценарий: Demo\n\n"
+        "1. Open app\n"
+        "Ожидаемый результат: Opened\n"
+        "Тестовые данные: user=a\n\n"
+        "2. Close app"
+    )
+
+
 def test_normalize_jira_testcase_keeps_precondition_only_in_report() -> None:
     payload = {
         "name": "[Android] Demo testcase",
@@ -151,6 +203,46 @@ def test_normalize_jira_testcase_keeps_precondition_only_in_report() -> None:
     assert report["preconditionText"] == "Toggle enabled\nClient prepared"
 
 
+def test_normalize_jira_testcase_flattens_lists_breaks_and_entities() -> None:
+    payload = {
+        "name": "Demo",
+        "precondition": "<ul><li>Client&nbsp;A</li><LI>Client B</LI></ul><BR />  Toggle \t  &amp; flag ",
+        "testScript": {"steps": [{"index": 0, "description": "Authorize"}]},
+    }
+
+    _normalized, report = normalize_jira_testcase(payload)
+
+    assert report["preconditionText"] == "Client A; Client B;\nToggle & flag"
+
+
+def test_selectolax_html_stripping_matches_regex_path(monkeypatch) -> None:
+    pytest.importorskip("selectolax")
+    samples = [
+        "<p>Open <b>login</b> page</p>",
+        "<ol><li>Step one</li><li>Step <i>two</i></li></ol>",
+        "line1<br>line2<br/>line3",
+        "<div><script>var x = 1;</script>after</div>",
+        "<style>p{color:red}</style><p>styled</p>",
+        "<!-- hidden --><p>shown</p>",
+        "a &amp; b &lt;c&gt; &nbsp;d",
+        "<ul><li>x<ul><li>nested</li></ul></li></ul>",
+        "Ввести <strong>логин</strong> и&nbsp;пароль<br>Нажать «Войти»",
+        "<p>multi\n  line   text</p>",
+    ]
+    with_selectolax = [jira_normalizer_module._clean_html_text(sample) for sample in samples]
+
+    monkeypatch.setattr(jira_normalizer_module, "LexborHTMLParser", None)
+
+    assert [jira_normalizer_module._clean_html_text(sample) for sample in samples] == with_selectolax
+
+
+def test_selectolax_html_stripping_handles_deep_nesting() -> None:
+    pytest.importorskip("selectolax")
+    raw = "<div>" * 5000 + "deep <b>text</b>" + "</div>" * 5000
+
+    assert jira_normalizer_module._clean_html_text(raw) == "deep text"
+
+
 def test_normalize_jira_testcase_uses_key_as_name_for_special_stub() -> None:
     payload = {
         "key": "SCBC-T1",
@@ -283,6 +375,10 @@ def test_jira_provider_returns_special_stub_payload_for_scbc_key(tmp_path) -> No
     assert result["key"] == "SCBC-T1"
     assert result["name"] == "Case one"
 
+    result["testScript"]["steps"].clear()
+    again = provider.fetch_testcase("scbc-t1")
+    assert again["testScript"]["steps"] == [{"index": 0, "description": "step"}]
+
 
 def test_jira_provider_non_special_key_uses_live_fetch_even_when_mode_is_stub(monkeypatch) -> None:
     provider = JiraTestcaseProvider(settings=Settings(jira_source_mode="stub"))
@@ -321,10 +417,7 @@ def test_jira_provider_live_client_uses_verify_false_when_disabled(monkeypatch)
 
     class _ResponseStub:
         status_code = 200
-
-        @staticmethod
-        def json() -> dict[str, Any]:
-            return {"key": "SCBC-T9999", "testScript": {"steps": [{"index": 0, "description": "step"}]}}
+        content = b'{"key": "SCBC-T9999", "testScript": {"steps": [{"index": 0, "description": "step"}]}}'
 
     class _ClientStub:
         def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -357,10 +450,7 @@ def test_jira_provider_live_client_uses_ca_bundle_when_configured(monkeypatch) -
 
     class _ResponseStub:
         status_code = 200
-
-        @staticmethod
-        def json() -> dict[str, Any]:
-            return {"key": "SCBC-T9999", "testScript": {"steps": [{"index": 0, "description": "step"}]}}
+        content = b'{"key": "SCBC-T9999", "testScript": {"steps": [{"index": 0, "description": "step"}]}}'
 
     class _ClientStub:
         def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -379,3 +469,147 @@ def test_jira_provider_live_client_uses_ca_bundle_when_configured(monkeypatch) -
     monkeypatch.setattr(jira_provider_module.httpx, "Client", _ClientStub)
     provider.fetch_testcase("SCBC-T9999")
     assert captured["client_kwargs"]["verify"] == "C:/certs/jira-ca.pem"
+
+
+def test_jira_provider_reuses_live_client_until_closed(monkeypatch) -> None:
+    provider = JiraTestcaseProvider(
+        settings=Settings(jira_source_mode="live", jira_default_instance="https://jira.example")
+    )
+    created: list["_ClientStub"] = []
+    requested: list[str] = []
+
+    class _ResponseStub:
+        status_code = 200
+        content = b'{"key": "SCBC-T9999"}'
+
+    class _ClientStub:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            self.closed = False
+            self.kwargs = kwargs
+            created.append(self)
+
+        def get(self, url: str, **kwargs: Any) -> _ResponseStub:
+            requested.append(url)
+            return _ResponseStub()
+
+        def close(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr(jira_provider_module.httpx, "Client", _ClientStub)
+    provider.fetch_testcase("SCBC-T9999")
+    provider.fetch_testcase("SCBC-T9998")
+    assert len(created) == 1
+    assert httpx.URL(requested[-1]).params["fields"] == JIRA_TESTCASE_FIELDS
+    assert requested[-1].startswith("https://jira.example/rest/atm/1.0/testcase/SCBC-T9998?")
+    provider.fetch_testcase("SCBC-T9997", jira_instance=" https://other.jira/ ")
+    assert requested[-1].startswith("https://other.jira/rest/atm/1.0/testcase/SCBC-T9997?fields=")
+
+    provider.close()
+    assert created[0].closed is True
+    with provider:
+        provider.fetch_testcase("SCBC-T9999")
+    assert len(created) == 2
+    assert created[1].closed is True
+    assert created[1].kwargs["headers"] == {"Accept": "application/json"}
+
+
+def test_jira_provider_rejects_invalid_json_body(monkeypatch) -> None:
+    provider = JiraTestcaseProvider(
+        settings=Settings(jira_source_mode="live", jira_default_instance="https://jira.example")
+    )
+
+    class _ResponseStub:
+        status_code = 200
+        content = b"<html>login</html>"
+
+    class _ClientStub:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            return None
+
+        def get(self, *args: Any, **kwargs: Any) -> _ResponseStub:
+            return _ResponseStub()
+
+    monkeypatch.setattr(jira_provider_module.httpx, "Client", _ClientStub)
+    with pytest.raises(RuntimeError, match="invalid JSON"):
+        provider.fetch_testcase("SCBC-T9999")
+
+
+def test_jira_provider_stub_template_is_shared_across_instances(tmp_path, monkeypatch) -> None:
+    stub_path = tmp_path / "jira_stub_shared.json"
+    stub_path.write_text('{"key": "X", "testScript": {"steps": []}}', encoding="utf-8")
+    settings = Settings(jira_source_mode="stub")
+
+    first = JiraTestcaseProvider(settings=settings, stub_payload_path=stub_path).fetch_testcase("SCBC-T1")
+    monkeypatch.setattr(jira_provider_module.orjson, "dumps", lambda *_args, **_kwargs: pytest.fail("re-parsed"))
+    second = JiraTestcaseProvider(settings=settings, stub_payload_path=stub_path).fetch_testcase("SCBC-T1")
+
+    assert first == second == {"key": "SCBC-T1", "testScript": {"steps": []}}
+    assert first is not second
+
+
+def test_jira_provider_truncates_large_error_body(monkeypatch) -> None:
+    provider = JiraTestcaseProvider(
+        settings=Settings(jira_source_mode="live", jira_default_instance="https://jira.example")
+    )
+
+    class _ResponseStub:
+        status_code = 502
+        content = ("Шлюз недоступен " * 2000).encode("utf-8")
+
+    class _ClientStub:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            return None
+
+        def get(self, *args: Any, **kwargs: Any) -> _ResponseStub:
+            return _ResponseStub()
+
+    monkeypatch.setattr(jira_provider_module.httpx, "Client", _ClientStub)
+    with pytest.raises(RuntimeError, match="Jira responded with 502: Шлюз недоступен") as exc_info:
+        provider.fetch_testcase("SCBC-T9999")
+    assert str(exc_info.value).endswith("...")
+    assert len(str(exc_info.value)) < 400
+
+
+def test_jira_provider_fetch_testcase_async_uses_pooled_async_client(monkeypatch) -> None:
+    provider = JiraTestcaseProvider(
+        settings=Settings(jira_source_mode="live", jira_default_instance="https://jira.example")
+    )
+    created: list["_AsyncClientStub"] = []
+
+    class _ResponseStub:
+        status_code = 200
+        content = b'{"key": "SCBC-T9999"}'
+
+    class _AsyncClientStub:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            self.kwargs = kwargs
+            self.urls: list[str] = []
+            self.closed = False
+            created.append(self)
+
+        async def get(self, url: str, **kwargs: Any) -> _ResponseStub:
+            self.urls.append(url)
+            assert kwargs["headers"] == {"Authorization": "Bearer token-value"}
+            return _ResponseStub()
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr(jira_provider_module.httpx, "AsyncClient", _AsyncClientStub)
+
+    async def _run() -> list[dict[str, Any]]:
+        auth = {"authType": "TOKEN", "token": "token-value"}
+        payloads = [
+            await provider.fetch_testcase_async("scbc-t9999", auth=auth),
+            await provider.fetch_testcase_async("SCBC-T9999", auth=auth),
+        ]
+        await provider.aclose()
+        return payloads
+
+    payloads = asyncio.run(_run())
+
+    assert payloads == [{"key": "SCBC-T9999"}, {"key": "SCBC-T9999"}]
+    assert len(created) == 1
+    assert created[0].closed is True
+    assert created[0].kwargs["headers"] == {"Accept": "application/json"}
+    assert all(url.startswith("https://jira.example/rest/atm/1.0/testcase/SCBC-T9999?fields=") for url in created[0].urls)
@@ -31,3 +31,39 @@ def test_memory_feedback_updates_step_boost(tmp_path) -> None:
     assert payload["projectRoot"] == "/tmp/project"
     assert payload["stepBoosts"]["step-1"] > 0.0
     assert payload["feedbackCount"] == 1
+
+
+def test_step_boosts_skip_malformed_values(tmp_path) -> None:
+    store = ProjectLearningStore(tmp_path / "learning")
+    store.save("/tmp/project", {"stepBoosts": {"a": 0.2, "b": "0.1", "c": "oops", "d": None, "e": [1]}})
+
+    boosts = store.get_step_boosts("/tmp/project")
+
+    assert boosts == {"a": 0.2, "b": 0.1}
+
+
+def test_save_skips_write_when_payload_is_unchanged(tmp_path) -> None:
+    store = ProjectLearningStore(tmp_path / "learning")
+    first = store.patch("/tmp/project", stepBoosts={"a": 0.1})
+    path = next((tmp_path / "learning").glob("*.json"))
+    mtime_ns = path.stat().st_mtime_ns
+
+    second = store.patch("/tmp/project", stepBoosts={"a": 0.1})
+
+    assert second["updatedAt"] == first["updatedAt"]
+    assert path.stat().st_mtime_ns == mtime_ns
+    third = store.patch("/tmp/project", stepBoosts={"a": 0.2})
+    assert third["stepBoosts"] == {"a": 0.2}
+    assert store.load("/tmp/project")["stepBoosts"] == {"a": 0.2}
+
+
+def test_save_rewrites_file_changed_by_another_writer(tmp_path) -> None:
+    store = ProjectLearningStore(tmp_path / "learning")
+    other = ProjectLearningStore(tmp_path / "learning")
+    store.save("/tmp/project", {"stepBoosts": {"a": 0.1}})
+    other.save("/tmp/project", {"stepBoosts": {"b": 0.5}})
+
+    again = store.save("/tmp/project", {"stepBoosts": {"a": 0.1}})
+
+    assert store.load("/tmp/project")["stepBoosts"] == {"a": 0.1}
+    assert store.load("/tmp/project")["updatedAt"] == again["updatedAt"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import tempfile
 import time
 from pathlib import Path
@@ -712,6 +713,23 @@ def test_opencode_create_session_eagerly_ensures_backend_mapping() -> None:
     assert adapter.sessions[session_id]["backendSessionId"].startswith("session-")
 
 
+def test_opencode_batch_status_and_history_cover_each_session() -> None:
+    app = _build_app()
+    client = TestClient(app)
+    session_ids = [
+        client.post("/sessions", json={"projectRoot": f"/tmp/project-{idx}", "runtime": "opencode"}).json()["sessionId"]
+        for idx in range(3)
+    ]
+    runtime = app.state.opencode_runtime
+
+    statuses = asyncio.run(runtime.batch_get_status(session_ids, concurrency=2))
+    histories = asyncio.run(runtime.batch_get_history(session_ids, limit=10))
+
+    assert list(statuses) == session_ids
+    assert all(statuses[session_id]["sessionId"] == session_id for session_id in session_ids)
+    assert all(histories[session_id]["sessionId"] == session_id for session_id in session_ids)
+
+
 def test_opencode_compact_command_emits_session_events() -> None:
     app = _build_app()
     client = TestClient(app)
@@ -247,6 +247,10 @@ class _FakeCursor:
 
         raise AssertionError(f"Unsupported SQL in fake cursor: {sql}")
 
+    def executemany(self, query: str, params_seq: list[tuple[Any, ...]]) -> None:
+        for params in params_seq:
+            self.execute(query, params)
+
     def fetchone(self) -> tuple[Any, ...] | None:
         if not self._results:
             return None
@@ -382,6 +386,15 @@ def test_postgres_run_state_store_updates_attempts_and_events(monkeypatch) -> No
     assert next_index == 2
     assert [item["event_type"] for item in events] == ["run.finished"]
 
+    store.append_events(
+        "run-2",
+        [("run.cancelled", {"runId": "run-2"}), ("run.finished", {"runId": "run-2", "status": "cancelled"})],
+    )
+    store.append_events("run-2", [])
+    events, next_index = store.list_events("run-2", since_index=2)
+    assert next_index == 4
+    assert [(item["event_type"], item["index"]) for item in events] == [("run.cancelled", 2), ("run.finished", 3)]
+
 
 def test_postgres_run_state_store_claims_idempotency_keys(monkeypatch) -> None:
     db = _FakePostgresDb()
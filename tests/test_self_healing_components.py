@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import json
+from datetime import datetime, timezone
 from pathlib import Path
 
+import pytest
+
+from app.observability import metrics, traced_span
 from infrastructure.artifact_store import ArtifactStore
-from infrastructure.run_state_store import RunStateStore
+from infrastructure import run_state_store as run_state_store_module
+from infrastructure.run_state_store import RunStateStore, utcnow_iso
+from self_healing import supervisor as supervisor_module
+from self_healing.capabilities import CapabilityRegistry
 from self_healing.failure_classifier import FailureClassifier
 from self_healing.remediation import RemediationPlaybooks
 
@@ -13,6 +21,40 @@ def test_failure_classifier_taxonomy() -> None:
     result = classifier.classify({"stderr": "connection reset by peer timeout 503"})
     assert result.category == "infra"
     assert result.confidence > 0.5
+    assert result.to_dict() == {
+        "category": "infra",
+        "confidence": 0.86,
+        "signals": ["network_or_infra_signal"],
+        "summary": "Infrastructure/network instability",
+    }
+
+
+def test_failure_classifier_prefers_higher_priority_overlapping_signal() -> None:
+    classifier = FailureClassifier()
+    # "seed" (data) overlaps "dns" (infra); infra must still win.
+    result = classifier.classify({"stdout": "SEEDNS", "stderr": "random ui locator"})
+    assert result.category == "infra"
+    assert result.signals == ["network_or_infra_signal"]
+    assert classifier.classify({"stdout": "random failure in ui"}).category == "automation"
+    assert classifier.classify({"stdout": ""}).category == "unknown"
+
+
+def test_failure_classifier_finds_token_at_end_of_large_log() -> None:
+    classifier = FailureClassifier()
+    log = "x" * 200_000
+    assert classifier.classify({"stdout": log}).category == "unknown"
+    assert classifier.classify({"stdout": log + " CONFIG"}).category == "env"
+    assert classifier.classify({"stdout": log + " config", "stderr": "dns"}).category == "infra"
+
+
+def test_failure_classifier_scans_artifacts_separately_by_priority() -> None:
+    class _NotLowered(str):
+        def lower(self) -> str:
+            raise AssertionError("artifact lowered after the top-priority rule matched")
+
+    classifier = FailureClassifier()
+    assert classifier.classify({"stdout": "config missing", "stderr": "Assert failed"}).category == "product"
+    assert classifier.classify({"stdout": "Timeout", "stderr": _NotLowered("config")}).category == "infra"
 
 
 def test_remediation_playbooks_allowlist() -> None:
@@ -23,6 +65,15 @@ def test_remediation_playbooks_allowlist() -> None:
     assert applied["applied"] is True
 
 
+def test_remediation_backoff_only_for_infra_retries() -> None:
+    playbooks = RemediationPlaybooks()
+    infra = playbooks.decide("infra")
+    assert [playbooks.backoff_for(infra, attempt) for attempt in range(3)] == [0.05, 0.1, 0.2]
+    assert playbooks.backoff_for(infra, 10) == 2.0
+    for category in ("flaky", "env", "data", "automation", "unknown"):
+        assert playbooks.backoff_for(playbooks.decide(category), 0) == 0.0
+
+
 def test_state_and_artifact_store(tmp_path: Path) -> None:
     state = RunStateStore()
     state.put_job({"run_id": "j1", "status": "queued"})
@@ -64,3 +115,138 @@ def test_run_state_store_evicts_old_jobs() -> None:
     assert state.get_job("j1") is None
     assert state.get_job("j2") is not None
     assert state.get_job("j3") is not None
+
+
+def test_run_state_store_job_bytes_is_detached_snapshot() -> None:
+    state = RunStateStore()
+    state.put_job({"run_id": "j1", "status": "queued", "attempts": []})
+    snapshot = state.get_job_bytes("j1")
+    state.patch_job("j1", status="running")
+
+    assert snapshot is not None
+    assert json.loads(snapshot) == {"run_id": "j1", "status": "queued", "attempts": []}
+    assert state.get_job_bytes("missing") is None
+
+
+def test_run_state_store_reads_are_isolated_from_later_writes() -> None:
+    state = RunStateStore()
+    state.put_job({"run_id": "j1", "status": "queued", "attempts": []})
+    state.append_attempt("j1", {"attempt_id": "a1", "status": "started"})
+    before = state.get_job("j1")
+
+    state.patch_attempt("j1", "a1", status="succeeded")
+    before["attempts"].append({"attempt_id": "rogue"})
+
+    assert before["attempts"][0]["status"] == "started"
+    assert [item["status"] for item in state.list_attempts("j1")] == ["succeeded"]
+    snapshot = state.snapshot("j1")
+    assert snapshot is not None
+    assert snapshot["attempts"] == [{"attempt_id": "a1", "status": "succeeded"}]
+
+
+def test_utcnow_iso_reuses_value_within_same_second(monkeypatch) -> None:
+    monkeypatch.setattr(run_state_store_module.time, "time", lambda: 1_700_000_000.25)
+    first = utcnow_iso()
+    monkeypatch.setattr(run_state_store_module.time, "time", lambda: 1_700_000_000.75)
+
+    assert utcnow_iso() is first
+    assert datetime.fromisoformat(first).timestamp() == 1_700_000_000
+
+
+def test_artifact_store_writes_readable_utf8_json(tmp_path: Path) -> None:
+    artifacts = ArtifactStore(tmp_path)
+    payload = {"message": "Сценарий готов", "attempts": [1, 2]}
+
+    path = artifacts.write_json(run_id="r1", execution_id="e1", attempt_id="a1", name="result.json", payload=payload)
+
+    text = Path(path).read_text(encoding="utf-8")
+    assert "Сценарий готов" in text
+    assert text == json.dumps(payload, ensure_ascii=False, indent=2)
+
+
+def test_supervisor_utcnow_matches_datetime_isoformat(monkeypatch) -> None:
+    for now_ns in (1_700_000_000_000_000_000, 1_700_000_000_123_456_789, 1_700_000_001_000_001_000):
+        monkeypatch.setattr(supervisor_module.time, "time_ns", lambda value=now_ns: value)
+        expected = (
+            datetime.fromtimestamp(now_ns // 1_000_000_000, timezone.utc)
+            .replace(microsecond=now_ns // 1_000 % 1_000_000)
+            .isoformat()
+        )
+        assert supervisor_module._utcnow() == expected
+
+
+def test_run_state_store_patch_attempt_and_event_applies_both() -> None:
+    state = RunStateStore()
+    state.put_job({"run_id": "j1", "status": "running", "attempts": []})
+    state.append_attempt("j1", {"attempt_id": "a1", "status": "started"})
+
+    patched = state.patch_attempt_and_event(
+        "j1",
+        "a1",
+        event_type="attempt.succeeded",
+        event_payload={"runId": "j1", "attemptId": "a1", "status": "succeeded"},
+        status="succeeded",
+    )
+
+    assert patched == {"attempt_id": "a1", "status": "succeeded"}
+    events, next_index = state.list_events("j1")
+    assert [event["event_type"] for event in events] == ["attempt.succeeded"]
+    assert next_index == 1
+
+
+def test_build_feature_result_dedupes_used_steps_in_order() -> None:
+    first = {"id": "s1", "pattern": "first"}
+    matched = [
+        {"status": "exact", "step_definition": first},
+        {"status": "unmatched", "step_definition": {"id": "s2"}},
+        {"status": "fuzzy", "step_definition": {"id": "s3"}},
+        {"status": "exact", "step_definition": {"id": "s1", "pattern": "duplicate"}},
+        {"status": "exact", "step_definition": {"id": ""}},
+        {"status": "exact", "step_definition": "not-a-dict"},
+        "not-a-dict",
+    ]
+
+    result = supervisor_module.ExecutionSupervisor._build_feature_result(
+        {"feature": {}, "matchResult": {"matched": matched}}
+    )
+
+    assert result["usedSteps"] == [first, {"id": "s3"}]
+    assert result["usedSteps"][0] is first
+
+
+def test_capability_registry_pipelines_by_profile() -> None:
+    registry = CapabilityRegistry()
+    quick = registry.build_pipeline("quick")
+    assert quick[-3:] == ("classify_failure", "rerun_with_strategy", "incident_report_builder")
+    assert "apply_remediation" not in quick
+    assert registry.build_pipeline("ci") is registry.build_pipeline("strict")
+    assert registry.build_pipeline("unknown") == registry.build_pipeline("strict")
+    assert len(registry.build_pipeline("strict")) == 10
+
+
+def test_run_state_store_append_events_keeps_order_and_retention() -> None:
+    state = RunStateStore(max_events_per_job=3)
+    state.put_job({"run_id": "j1", "status": "running", "attempts": []})
+    state.append_event("j1", "run.running", {"runId": "j1"})
+    state.append_events("j1", [("run.incident", {"n": 1}), ("run.cancelled", {"n": 2}), ("run.finished", {"n": 3})])
+
+    events, next_index = state.list_events("j1")
+    assert [(event["event_type"], event["index"]) for event in events] == [
+        ("run.incident", 1),
+        ("run.cancelled", 2),
+        ("run.finished", 3),
+    ]
+    assert next_index == 4
+
+
+def test_traced_span_counts_calls_and_propagates_errors() -> None:
+    before = metrics.snapshot().values.get("trace.unit_span.count", 0)
+    with traced_span("unit_span"):
+        pass
+    with pytest.raises(ValueError):
+        with traced_span("unit_span"):
+            raise ValueError("boom")
+
+    values = metrics.snapshot().values
+    assert values["trace.unit_span.count"] == before + 2
+    assert values["trace.unit_span.elapsed_ms_total"] >= 0
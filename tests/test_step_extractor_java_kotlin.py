@@ -1,4 +1,7 @@
+from collections import OrderedDict
+
 from infrastructure.fs_repo import FsRepository
+from tools import step_extractor as step_extractor_module
 from tools.step_extractor import StepExtractor
 from domain.enums import StepKeyword, StepPatternType
 
@@ -116,3 +119,125 @@ def test_default_patterns_include_step_definitions_suffix(tmp_path) -> None:
     assert len(steps) == 1
     assert steps[0].implementation.method_name == "toastShown"
     assert steps[0].parameters[0].name == "message"
+
+
+def test_tracks_class_scope_across_skipped_lines() -> None:
+    lines = [
+        "package steps;",
+        "",
+        "public class OuterSteps",
+        "{",
+        "    // plain comment",
+        "    @Given(\"outer step\")",
+        "    public void outer() {}",
+        "",
+        "    static class InnerSteps {",
+        "        @When(\"inner step\")",
+        "        public void inner() {}",
+        "    }",
+        "",
+        "    @Then(\"outer again\")",
+        "    public void outerAgain() {}",
+        "}",
+        "@And(\"top level\")",
+    ]
+
+    annotations = list(StepExtractor._iter_annotations(lines))
+
+    assert [(item.line_number, item.class_name, item.method_name) for item in annotations] == [
+        (6, "OuterSteps", "outer"),
+        (10, "InnerSteps", "inner"),
+        (14, "OuterSteps", "outerAgain"),
+        (17, None, None),
+    ]
+
+
+def test_skips_sources_without_annotations(tmp_path) -> None:
+    (tmp_path / "EmptySteps.java").write_text("")
+    (tmp_path / "HelperSteps.java").write_text("public class HelperSteps {}\n")
+    (tmp_path / "UiSteps.java").write_text('public class UiSteps {\n    @Given("user logs in")\n    public void login() {}\n}\n')
+
+    repo = FsRepository(str(tmp_path))
+    assert repo.file_contains("UiSteps.java", b"@") is True
+    assert repo.file_contains("HelperSteps.java", b"@") is False
+    assert repo.file_contains("EmptySteps.java", b"@") is False
+
+    steps = StepExtractor(repo, patterns=["**/*.java"]).extract_steps()
+    assert [step.implementation.class_name for step in steps] == ["UiSteps"]
+
+
+def test_parallel_extraction_matches_serial_order(tmp_path, monkeypatch) -> None:
+    for index in range(6):
+        (tmp_path / f"Flow{index}Steps.java").write_text(
+            f'public class Flow{index}Steps {{\n    @When("flow {index} runs")\n    public void run{index}() {{}}\n}}\n'
+        )
+    extractor = StepExtractor(FsRepository(str(tmp_path)), patterns=["**/*.java"], max_workers=2)
+    serial = [(step.id, step.pattern) for step in extractor.extract_steps()]
+
+    monkeypatch.setattr(step_extractor_module, "_file_cache", OrderedDict())
+    monkeypatch.setattr(step_extractor_module, "_PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(step_extractor_module.os, "cpu_count", lambda: 2)
+    parallel = [(step.id, step.pattern) for step in extractor.extract_steps()]
+
+    assert len(serial) == 6
+    assert parallel == serial
+
+
+def test_extraction_stays_serial_unless_workers_are_enabled(tmp_path, monkeypatch) -> None:
+    for index in range(4):
+        (tmp_path / f"Serial{index}Steps.java").write_text(f'class Serial{index}Steps {{\n    @When("serial {index}")\n    void run() {{}}\n}}\n')
+    monkeypatch.setattr(step_extractor_module, "_PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr(step_extractor_module.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(step_extractor_module, "ProcessPoolExecutor", None)
+
+    steps = StepExtractor(FsRepository(str(tmp_path)), patterns=["**/*.java"]).extract_steps()
+
+    assert sorted(step.pattern for step in steps) == ["serial 0", "serial 1", "serial 2", "serial 3"]
+
+
+def test_rescan_reuses_unchanged_files_and_rereads_modified_ones(tmp_path, monkeypatch) -> None:
+    (tmp_path / "CacheSteps.java").write_text('class CacheSteps {\n    @Given("cached")\n    void cached() {}\n}\n')
+    repo = FsRepository(str(tmp_path))
+    reads: list[str] = []
+    read_text_file = repo.read_text_file
+    monkeypatch.setattr(repo, "read_text_file", lambda path: reads.append(path) or read_text_file(path))
+
+    first = StepExtractor(repo, patterns=["**/*.java"]).extract_steps()
+    first[0].pattern = "mutated by caller"
+    second = StepExtractor(repo, patterns=["**/*.java"]).extract_steps()
+    assert reads == ["CacheSteps.java"]
+    assert [step.pattern for step in second] == ["cached"]
+
+    (tmp_path / "CacheSteps.java").write_text('class CacheSteps {\n    @Given("cache refreshed")\n    void cached() {}\n}\n')
+    third = StepExtractor(repo, patterns=["**/*.java"]).extract_steps()
+    assert reads == ["CacheSteps.java", "CacheSteps.java"]
+    assert [step.pattern for step in third] == ["cache refreshed"]
+
+
+def test_iter_steps_streams_file_by_file(tmp_path) -> None:
+    (tmp_path / "AlphaSteps.java").write_text('class AlphaSteps {\n    @Given("alpha")\n    void alpha() {}\n}\n')
+    (tmp_path / "BetaSteps.java").write_text('class BetaSteps {\n    @Then("beta")\n    void beta() {}\n}\n')
+    extractor = StepExtractor(FsRepository(str(tmp_path)), patterns=["**/*.java"])
+
+    stream = extractor.iter_steps()
+    first = next(stream)
+
+    assert first.implementation.file in {"AlphaSteps.java", "BetaSteps.java"}
+    assert [first, *stream] == extractor.extract_steps()
+
+
+def test_annotation_strings_handle_escapes_raw_strings_and_unterminated_lines() -> None:
+    lines = [
+        '@Then("user sees \\"Welcome\\"")',
+        '@Given("""^user (\\d+) logs in$""")',
+        '@When("x" ' * 2000,
+        "@And('short')",
+    ]
+
+    annotations = list(StepExtractor._iter_annotations(lines))
+
+    assert [(item.keyword, item.pattern) for item in annotations] == [
+        (StepKeyword.THEN, 'user sees \\"Welcome\\"'),
+        (StepKeyword.GIVEN, "^user (\\d+) logs in$"),
+        (StepKeyword.AND, "short"),
+    ]
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, fields
+from datetime import datetime
+from pathlib import Path
+
+from domain.enums import StepKeyword
+from domain.models import StepDefinition, StepImplementation
+from infrastructure.step_index_store import SqliteStepIndexStore, StepIndexStore
+
+
+def _step(step_id: str, pattern: str) -> StepDefinition:
+    return StepDefinition(
+        id=step_id,
+        keyword=StepKeyword.GIVEN,
+        pattern=pattern,
+        regex=None,
+        code_ref=f"steps.{step_id}",
+        parameters=[],
+        tags=["smoke"],
+        language="ru",
+        implementation=StepImplementation(file="Steps.java", line=10, class_name="Steps", method_name=step_id),
+    )
+
+
+def test_step_index_store_round_trip(tmp_path: Path) -> None:
+    store = StepIndexStore(str(tmp_path / "index"))
+    project_root = str(tmp_path / "project")
+    steps = [_step("s1", "пользователь открывает {string}"), _step("s2", "user logs in")]
+
+    store.save_steps(project_root, steps)
+    loaded = store.load_steps(project_root)
+
+    assert [step.id for step in loaded] == ["s1", "s2"]
+    assert loaded[0].pattern == "пользователь открывает {string}"
+    assert loaded[0].implementation == steps[0].implementation
+    assert loaded[1].tags == ["smoke"]
+    assert store.get_last_updated_at(project_root) is not None
+
+
+def test_step_index_store_clear_removes_index(tmp_path: Path) -> None:
+    store = StepIndexStore(str(tmp_path / "index"))
+    project_root = str(tmp_path / "project")
+    store.save_steps(project_root, [_step("s1", "user logs in")])
+
+    store.clear(project_root)
+
+    assert store.load_steps(project_root) == []
+    assert store.get_last_updated_at(project_root) is None
+
+
+def test_sqlite_step_index_store_rewrites_only_changed_steps(tmp_path: Path) -> None:
+    store = SqliteStepIndexStore(str(tmp_path / "index"))
+    project_root = str(tmp_path / "project")
+    store.save_steps(project_root, [_step("s1", "user logs in"), _step("s2", "user logs out")])
+
+    store.save_steps(project_root, [_step("s3", "user opens {string}"), _step("s1", "user logs in")])
+    loaded = store.load_steps(project_root)
+
+    assert [step.id for step in loaded] == ["s3", "s1"]
+    assert loaded[0].regex is not None
+    assert loaded[1].implementation == _step("s1", "user logs in").implementation
+    assert store.get_last_updated_at(project_root) is not None
+
+    store.clear(project_root)
+    assert store.load_steps(project_root) == []
+    assert store.get_last_updated_at(project_root) is None
+    store.close()
+
+
+def test_step_index_store_save_leaves_no_temp_files(tmp_path: Path) -> None:
+    store = StepIndexStore(str(tmp_path / "index"))
+    project_root = str(tmp_path / "project")
+    store.save_steps(project_root, [_step("s1", "user logs in")])
+    store.save_steps(project_root, [_step("s2", "user logs out")])
+
+    files = [path.name for path in store._project_dir(project_root).iterdir()]
+    assert files == ["steps.msgpack"]
+    assert [step.id for step in store.load_steps(project_root)] == ["s2"]
+
+
+def test_serialize_step_covers_every_dataclass_field() -> None:
+    step = _step("s1", "user opens {string}")
+
+    data = StepIndexStore._serialize_step(step)
+
+    assert list(data) == [item.name for item in fields(StepDefinition)]
+    assert data["keyword"] == StepKeyword.GIVEN.value
+    assert data["implementation"] == asdict(step.implementation)
+
+
+def test_step_index_store_migrates_legacy_json_index(tmp_path: Path) -> None:
+    store = StepIndexStore(str(tmp_path / "index"))
+    project_root = str(tmp_path / "project")
+    target_dir = store._project_dir(project_root)
+    target_dir.mkdir(parents=True)
+    legacy_payload = {
+        "schema_version": 3,
+        "updated_at": "2024-05-01T10:00:00",
+        "steps": [StepIndexStore._serialize_step(_step("s1", "user logs in"))],
+    }
+    (target_dir / "steps.json").write_text(json.dumps(legacy_payload), encoding="utf-8")
+
+    assert store.get_last_updated_at(project_root) == datetime(2024, 5, 1, 10, 0, 0)
+    assert [step.id for step in store.load_steps(project_root)] == ["s1"]
+
+    assert [path.name for path in target_dir.iterdir()] == ["steps.msgpack"]
+    assert [step.id for step in store.load_steps(project_root)] == ["s1"]
+    assert store.get_last_updated_at(project_root) == datetime(2024, 5, 1, 10, 0, 0)
+
+
+def test_step_index_stores_count_steps_across_projects(tmp_path: Path) -> None:
+    file_store = StepIndexStore(str(tmp_path / "file-index"))
+    sqlite_store = SqliteStepIndexStore(str(tmp_path / "sqlite-index"))
+    for store in (file_store, sqlite_store):
+        assert store.count_steps() == 0
+        store.save_steps(str(tmp_path / "alpha"), [_step("s1", "user logs in"), _step("s2", "user logs out")])
+        store.save_steps(str(tmp_path / "beta"), [_step("s3", "user opens {string}")])
+        assert store.count_steps() == 3
+    sqlite_store.close()
+
+    legacy_dir = tmp_path / "file-index" / "legacy-project"
+    legacy_dir.mkdir()
+    (legacy_dir / "steps.json").write_text(json.dumps({"steps": [{"id": "s4"}]}), encoding="utf-8")
+    (tmp_path / "file-index" / "broken").mkdir()
+    (tmp_path / "file-index" / "broken" / "steps.msgpack").write_bytes(b"\xc1")
+    assert file_store.count_steps() == 4
+
+
+def test_sqlite_step_index_store_insert_at_top_writes_only_new_step(tmp_path: Path) -> None:
+    store = SqliteStepIndexStore(str(tmp_path / "index"))
+    project_root = str(tmp_path / "project")
+    store.save_steps(project_root, [_step(f"s{index}", f"step {index}") for index in range(5)])
+
+    changes_before = store._conn.total_changes
+    store.save_steps(
+        project_root,
+        [_step("top", "new step")] + [_step(f"s{index}", f"step {index}") for index in range(5)],
+    )
+
+    assert store._conn.total_changes - changes_before == 2
+    assert [step.id for step in store.load_steps(project_root)] == ["top", "s0", "s1", "s2", "s3", "s4"]
+    store.close()
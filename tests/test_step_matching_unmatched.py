@@ -70,3 +70,21 @@ def test_feature_generator_renders_placeholder_without_todo() -> None:
     assert "TODO" not in rendered
     assert f"{StepKeyword.WHEN.as_text('ru')} <no_definition_found: {test_step.text}>" in rendered
 
+
+def test_step_definition_compiled_regex_is_shared_and_tolerates_invalid_patterns() -> None:
+    first = StepDefinition(id="a", keyword=StepKeyword.GIVEN, pattern="x", regex=r"^user (\d+)$", code_ref="a")
+    second = StepDefinition(id="b", keyword=StepKeyword.GIVEN, pattern="x", regex=r"^user (\d+)$", code_ref="b")
+
+    assert first.compiled_regex is second.compiled_regex
+    assert first.compiled_regex.search("user 42").group(1) == "42"
+    assert StepDefinition(id="c", keyword=StepKeyword.GIVEN, pattern="x", regex="(", code_ref="c").compiled_regex is None
+    assert StepDefinition(id="d", keyword=StepKeyword.GIVEN, pattern="x", regex=None, code_ref="d").compiled_regex is None
+
+
+def test_replace_placeholders_fills_positionally_in_one_pass() -> None:
+    matcher = StepMatcher()
+
+    assert matcher._replace_placeholders("{string} sends {int} to {string}", ['"{int}"', " 5 ", "bob"]) == (
+        "{int} sends 5 to bob"
+    )
+    assert matcher._replace_placeholders("open {word} then {word}", ["menu"]) == "open menu then {word}"
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
+from infrastructure.artifact_index_store import InMemoryArtifactIndexStore
 from infrastructure.artifact_store import ArtifactStore
 from infrastructure.run_state_store import RunStateStore
 from self_healing.supervisor import ExecutionSupervisor
@@ -307,3 +308,167 @@ def test_supervisor_marks_run_needs_attention_when_generation_is_blocked(tmp_pat
     assert attempts
     classification = attempts[0].get("classification", {})
     assert classification.get("category") == "requirements"
+
+
+class _SignallingOrchestrator:
+    def __init__(self, run_id: str) -> None:
+        self._run_id = run_id
+        self.supervisor: ExecutionSupervisor | None = None
+
+    def generate_feature(self, *_args, **_kwargs):
+        assert self.supervisor is not None
+        self.supervisor.request_cancel(self._run_id)
+        return {
+            "feature": {"featureText": "Feature: demo", "unmappedSteps": []},
+            "matchResult": {"matched": [], "unmatched": []},
+        }
+
+
+def test_supervisor_honours_in_process_cancel_signal(tmp_path: Path) -> None:
+    store = RunStateStore()
+    run_id = "job-cancel-signal"
+    store.put_job(
+        {
+            "run_id": run_id,
+            "status": "queued",
+            "cancel_requested": False,
+            "project_root": "/tmp/project",
+            "test_case_text": "Given user is logged in",
+            "target_path": None,
+            "create_file": False,
+            "overwrite_existing": False,
+            "language": None,
+            "profile": "quick",
+            "source": "tests",
+            "started_at": "2026-01-01T00:00:00+00:00",
+            "updated_at": "2026-01-01T00:00:00+00:00",
+            "attempts": [],
+            "result": None,
+        }
+    )
+    orchestrator = _SignallingOrchestrator(run_id)
+    supervisor = ExecutionSupervisor(
+        orchestrator=orchestrator,
+        run_state_store=store,
+        artifact_store=ArtifactStore(tmp_path / "artifacts"),
+    )
+    orchestrator.supervisor = supervisor
+
+    asyncio.run(supervisor.execute_run(run_id))
+
+    item = store.get_job(run_id)
+    assert item is not None
+    assert item["status"] == "cancelled"
+    assert supervisor._cancel_events == {}
+    supervisor.request_cancel(run_id)
+
+
+def _queued_run(run_id: str) -> dict:
+    return {
+        "run_id": run_id,
+        "status": "queued",
+        "cancel_requested": False,
+        "project_root": "/tmp/project",
+        "test_case_text": "generate autotest",
+        "target_path": None,
+        "create_file": False,
+        "overwrite_existing": False,
+        "language": None,
+        "quality_policy": "strict",
+        "profile": "quick",
+        "source": "tests",
+        "started_at": "2026-01-01T00:00:00+00:00",
+        "updated_at": "2026-01-01T00:00:00+00:00",
+        "attempts": [],
+        "result": None,
+    }
+
+
+def test_supervisor_publishes_attempt_artifacts_before_exposing_them(tmp_path: Path) -> None:
+    artifacts = ArtifactStore(tmp_path / "artifacts", index_store=InMemoryArtifactIndexStore())
+    unresolved: list[str] = []
+
+    class _ResolvingRunStateStore(RunStateStore):
+        def patch_attempt_and_event(self, run_id, attempt_id, **kwargs):
+            for uri in (kwargs.get("artifacts") or {}).values():
+                if artifacts.get_artifact(str(uri).removeprefix("artifact://")) is None:
+                    unresolved.append(uri)
+            return super().patch_attempt_and_event(run_id, attempt_id, **kwargs)
+
+    store = _ResolvingRunStateStore()
+    run_id = "job-artifacts-published"
+    store.put_job(_queued_run(run_id))
+    supervisor = ExecutionSupervisor(
+        orchestrator=_QualityFailingOrchestrator(),
+        run_state_store=store,
+        artifact_store=artifacts,
+    )
+
+    asyncio.run(supervisor.execute_run(run_id))
+
+    item = store.get_job(run_id)
+    assert item is not None
+    attempt_artifacts = item["attempts"][0]["artifacts"]
+    for key, name in (("featureResult", "feature-result.json"), ("failureClassification", "failure-classification.json")):
+        artifact_id = str(attempt_artifacts[key]).removeprefix("artifact://")
+        published = artifacts.get_artifact(artifact_id)
+        assert published is not None
+        assert published["name"] == name
+        assert published["uri"] == attempt_artifacts[key]
+    assert unresolved == []
+
+
+def test_supervisor_flags_run_when_artifact_publish_fails(tmp_path: Path) -> None:
+    class _FailingArtifactStore(ArtifactStore):
+        def publish_json(self, **kwargs):
+            if kwargs["name"] == "feature-result.json":
+                raise OSError("disk full")
+            return super().publish_json(**kwargs)
+
+    store = RunStateStore()
+    run_id = "job-artifact-publish-fails"
+    store.put_job(_queued_run(run_id))
+    supervisor = ExecutionSupervisor(
+        orchestrator=_CapturingOrchestrator(),
+        run_state_store=store,
+        artifact_store=_FailingArtifactStore(tmp_path / "artifacts"),
+    )
+
+    asyncio.run(supervisor.execute_run(run_id))
+
+    item = store.get_job(run_id)
+    assert item is not None
+    assert item["status"] == "needs_attention"
+    events, _ = store.list_events(run_id)
+    incident = next(event for event in events if event["event_type"] == "run.incident")["payload"]["incident"]
+    assert incident["summary"] == "Auto-remediation stopped: disk full"
+    assert incident["attemptId"] == item["attempts"][0]["attempt_id"]
+    assert item["attempts"][0]["artifacts"] == {}
+
+
+def test_supervisor_keeps_blocked_incident_when_artifact_publish_fails(tmp_path: Path) -> None:
+    class _FailingArtifactStore(ArtifactStore):
+        def publish_json(self, **kwargs):
+            if kwargs["name"] == "feature-result.json":
+                raise OSError("bucket unavailable")
+            return super().publish_json(**kwargs)
+
+    store = RunStateStore()
+    run_id = "job-blocked-publish-fails"
+    store.put_job(_queued_run(run_id))
+    supervisor = ExecutionSupervisor(
+        orchestrator=_BlockedGenerationOrchestrator(),
+        run_state_store=store,
+        artifact_store=_FailingArtifactStore(tmp_path / "artifacts"),
+    )
+
+    asyncio.run(supervisor.execute_run(run_id))
+
+    item = store.get_job(run_id)
+    assert item is not None
+    assert item["status"] == "needs_attention"
+    events, _ = store.list_events(run_id)
+    incident = next(event for event in events if event["event_type"] == "run.incident")["payload"]["incident"]
+    assert incident["summary"] == "Auto-remediation stopped: Actor and observable outcome must be clarified"
+    assert incident["attemptId"] == item["attempts"][0]["attempt_id"]
+    assert incident["errors"] == ["bucket unavailable"]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+
+from infrastructure.task_registry import TaskRegistry
+
+
+async def _noop() -> None:
+    return None
+
+
+def test_task_registry_returns_detached_entries() -> None:
+    async def _scenario() -> None:
+        registry = TaskRegistry()
+        task_id = registry.create_task(_noop(), source="runs", metadata={"runId": "r1"})
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        entry = registry.get_task(task_id)
+        assert entry is not None
+        assert entry["status"] == "completed"
+        assert entry["created_at"].endswith("+00:00")
+        assert entry["updated_at"] >= entry["created_at"]
+        entry["metadata"]["runId"] = "mutated"
+        entry["status"] = "mutated"
+
+        fresh = registry.get_task(task_id)
+        assert fresh is not None
+        assert fresh["metadata"] == {"runId": "r1"}
+        assert fresh["status"] == "completed"
+
+    asyncio.run(_scenario())
+
+
+def test_task_registry_lists_newest_first_and_evicts_oldest() -> None:
+    async def _scenario() -> None:
+        registry = TaskRegistry(max_entries=32)
+        task_ids = [registry.create_task(_noop(), source="runs" if idx % 2 else "chat") for idx in range(34)]
+        await asyncio.sleep(0)
+
+        assert registry.get_task(task_ids[0]) is None
+        assert registry.get_task(task_ids[1]) is None
+        listed = registry.list_tasks(limit=3)
+        assert [item["task_id"] for item in listed] == task_ids[-1:-4:-1]
+        run_items = registry.list_tasks(source="runs", limit=2)
+        assert [item["task_id"] for item in run_items] == [task_ids[33], task_ids[31]]
+
+    asyncio.run(_scenario())
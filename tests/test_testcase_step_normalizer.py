@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import pytest
+
 from domain.models import TestStep
 from infrastructure.llm_client import LLMClient
 from tools.testcase_step_normalizer import (
+    build_normalization_section,
     normalize_source_step_text,
     normalize_source_step_text_with_meta,
     normalize_test_steps,
@@ -70,3 +73,14 @@ def test_normalize_test_steps_attaches_normalization_section() -> None:
     assert section_meta is not None
     assert section_meta["normalizedFrom"] == source_steps[0].text
     assert section_meta["normalizationStrategy"] == "rule"
+
+
+def test_parse_normalization_section_is_cached_and_read_only() -> None:
+    section = build_normalization_section(normalized_from="Дано шаг", strategy="rule")
+
+    first = parse_normalization_section(section)
+    assert first is parse_normalization_section(section)
+    assert dict(first) == {"normalizedFrom": "Дано шаг", "normalizationStrategy": "rule"}
+    with pytest.raises(TypeError):
+        first["normalizedFrom"] = "mutated"
+    assert parse_normalization_section("plain section") is None